@@ -7,6 +7,7 @@ import click
 import yaml
 from pydantic import ValidationError
 
+from app_manifest.services import _json
 from app_manifest.services.component_builder import build_component_manifest
 from app_manifest.services.config_loader import load_build_config
 from app_manifest.services.artifact_fetcher import fetch_components_from_config
@@ -100,7 +101,7 @@ def generate(config, out, app_version, app_name, validate, component_files):
 
 @cli.command("component")
 @click.option("--input", "-i", "input_file", required=True, type=click.Path(exists=True, path_type=Path), help="CI metadata JSON file")
-@click.option("--out", "-o", required=True, type=click.Path(path_type=Path), help="Output CycloneDX mini-manifest JSON file")
+@click.option("--out", "-o", required=True, type=click.Path(path_type=Path, allow_dash=True), help="Output CycloneDX mini-manifest JSON file ('-' for stdout)")
 @click.option("--registry-def", "-r", "registry_def", default=None, type=click.Path(exists=True, path_type=Path), help="Registry Definition YAML file")
 def component(input_file, out, registry_def):
     """Generate a CycloneDX mini-manifest for a single component."""
@@ -110,8 +111,11 @@ def component(input_file, out, registry_def):
 
         bom = build_component_manifest(meta, regdef)
 
-        _write_output(bom, out)
-        click.echo(f"Component manifest written to {out}")
+        if str(out) == "-":
+            click.echo(_dump_bom(bom))
+        else:
+            _write_output(bom, out)
+            click.echo(f"Component manifest written to {out}")
 
     except click.ClickException:
         raise
@@ -120,22 +124,26 @@ def component(input_file, out, registry_def):
 
 
 @cli.command("validate")
-@click.option("--input", "-i", "input_file", required=True, type=click.Path(exists=True, path_type=Path), help="Application Manifest JSON file to validate")
+@click.option("--input", "-i", "input_file", required=True, type=click.Path(exists=True, path_type=Path, allow_dash=True), help="Application Manifest JSON file to validate ('-' for stdin)")
 def validate(input_file):
     """Validate an Application Manifest JSON file against the JSON Schema."""
+    source = "<stdin>" if str(input_file) == "-" else input_file
+    # open_file maps "-" to Click's binary stdin and leaves it open.
+    with click.open_file(str(input_file), "rb") as f:
+        raw = f.read()
     try:
-        data = json.loads(Path(input_file).read_text(encoding="utf-8"))
+        data = _json.loads(raw)
     except json.JSONDecodeError as e:
-        raise click.ClickException(f"Invalid JSON in {input_file}: {e}")
+        raise click.ClickException(f"Invalid JSON in {source}: {e}")
 
     errors = validate_manifest(data)
     if errors:
-        click.echo(f"Validation FAILED: {input_file}", err=True)
+        click.echo(f"Validation FAILED: {source}", err=True)
         for error in errors:
             click.echo(f"  - {error}", err=True)
         raise click.ClickException("Manifest does not conform to JSON Schema")
 
-    click.echo(f"Manifest is valid: {input_file}")
+    click.echo(f"Manifest is valid: {source}")
 
 
 @cli.command("fetch")
@@ -330,11 +338,14 @@ def convert(input_file, out, direction, registry_def, config_file, zip_file, app
         raise click.ClickException(str(e))
 
 
+def _dump_bom(bom) -> str:
+    return json.dumps(bom.model_dump(by_alias=True, exclude_none=True), indent=2, ensure_ascii=False)
+
+
 def _write_output(bom, out_path: Path):
-    bom_dict = bom.model_dump(by_alias=True, exclude_none=True)
     out_path.parent.mkdir(parents=True, exist_ok=True)
     with open(out_path, "w", encoding="utf-8") as f:
-        json.dump(bom_dict, f, indent=2, ensure_ascii=False)
+        f.write(_dump_bom(bom))
 
 
 if __name__ == "__main__":
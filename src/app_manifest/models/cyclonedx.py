@@ -40,6 +40,8 @@ class CdxHash(BaseModel):
     alg: str
     content: str
 
+    model_config = {"frozen": True}
+
 
 # ─── Properties ─────────────────────────────────────────────
 
@@ -53,6 +55,8 @@ class CdxProperty(BaseModel):
     name: str
     value: Any
 
+    model_config = {"frozen": True}
+
 
 # ─── Nested data (values.schema.json, resource-profiles) ──────
 
@@ -147,7 +151,7 @@ class CdxDependency(BaseModel):
         serialization_alias="dependsOn",
     )
 
-    model_config = {"populate_by_name": True}
+    model_config = {"populate_by_name": True, "frozen": True}
 
 
 # ─── Metadata ─────────────────────────────────────────────
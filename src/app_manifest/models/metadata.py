@@ -44,6 +44,8 @@ class HashEntry(BaseModel):
     alg: str
     content: str
 
+    model_config = {"frozen": True}
+
 
 class MetadataAttachment(BaseModel):
     """Attachment with base64-encoded content from CI metadata."""
@@ -109,4 +111,5 @@ class ComponentMetadata(BaseModel):
     reference: str | None = None
     components: list[MetadataNestedComponent] = Field(default_factory=list)
 
-    model_config = {"populate_by_name": True}
+    # Read-only once loaded; use model_copy(update=...) for a changed copy.
+    model_config = {"populate_by_name": True, "frozen": True}
@@ -0,0 +1,40 @@
+"""Parse-once cache for file loaders.
+
+A loader wrapped with `stat_cached` parses each file once and reuses the
+result until the file's mtime or size changes. Every call returns a deep
+copy of the cached model, so callers may mutate what they get back.
+"""
+
+import functools
+import os
+import time
+from pathlib import Path
+
+# Filesystem timestamps can be as coarse as a kernel tick, so a change made
+# right after a read may leave mtime untouched. Anything modified this
+# recently is re-read instead of trusted (the same idea as git's "racy clean").
+_RACY_WINDOW_NS = 2_000_000_000
+
+
+def is_racy(mtime_ns: int) -> bool:
+    """True if *mtime_ns* is too recent to prove the file is unchanged."""
+    return time.time_ns() - mtime_ns < _RACY_WINDOW_NS
+
+
+def stat_cached(loader):
+    """Cache *loader*(path) on (absolute path, st_mtime_ns, st_size)."""
+
+    @functools.lru_cache(maxsize=128)
+    def _cached(path, _abspath: str, _mtime_ns: int, _size: int):
+        return loader(path)
+
+    @functools.wraps(loader)
+    def wrapper(path: Path):
+        st = os.stat(path)  # raises FileNotFoundError like open() did
+        if is_racy(st.st_mtime_ns):
+            return loader(path)
+        model = _cached(path, os.path.abspath(path), st.st_mtime_ns, st.st_size)
+        return model.model_copy(deep=True)
+
+    wrapper.cache_clear = _cached.cache_clear
+    return wrapper
@@ -0,0 +1,60 @@
+"""JSON decoding backed by orjson when it is installed.
+
+Both backends reject a UTF-8 BOM, invalid UTF-8, NaN/Infinity literals,
+numbers that overflow a float and lone surrogate escapes, and report
+nesting deeper than they support as json.JSONDecodeError (orjson stops at
+1024 levels, the stdlib at the interpreter's recursion limit).
+orjson.JSONDecodeError subclasses json.JSONDecodeError, so callers catch
+the same exception with either one.
+
+They differ on integers wider than 64 bits: orjson turns them into floats.
+Use loads_exact for documents whose values are copied to output verbatim.
+"""
+
+import json
+import math
+import re
+
+try:
+    import orjson
+except ImportError:  # optional: pip install app-manifest-cli[fast]
+    orjson = None
+
+# Any \uD800-\uDFFF escape; a valid pair decodes to one non-surrogate char.
+_SURROGATE_ESCAPE_RE = re.compile(r"\\u[dD][89a-fA-F]")
+
+
+def _reject_constant(name: str):
+    raise json.JSONDecodeError(f"Unexpected constant {name}", name, 0)
+
+
+def _parse_float(text: str) -> float:
+    value = float(text)
+    if math.isinf(value):
+        raise json.JSONDecodeError(f"Number out of range: {text}", text, 0)
+    return value
+
+
+def _stdlib_loads(data: bytes | str):
+    """json.loads held to the rejections orjson makes; integers stay exact."""
+    if isinstance(data, (bytes, bytearray)):
+        try:
+            # Plain utf-8, not utf-8-sig: a leading BOM stays in the text and
+            # json.loads rejects it, as orjson does.
+            data = data.decode("utf-8")
+        except UnicodeDecodeError as e:
+            raise json.JSONDecodeError(f"Invalid UTF-8: {e.reason}", "", e.start) from None
+    try:
+        result = json.loads(data, parse_constant=_reject_constant, parse_float=_parse_float)
+    except RecursionError:
+        raise json.JSONDecodeError("Nesting too deep", data, 0) from None
+    if _SURROGATE_ESCAPE_RE.search(data):
+        try:
+            json.dumps(result, ensure_ascii=False).encode("utf-8")
+        except UnicodeEncodeError as e:
+            raise json.JSONDecodeError("Lone surrogate in string", data, 0) from e
+    return result
+
+
+loads = orjson.loads if orjson is not None else _stdlib_loads
+loads_exact = _stdlib_loads
@@ -0,0 +1,15 @@
+"""YAML loading backed by libyaml when PyYAML was built with it.
+
+CSafeLoader resolves the same safe tags as SafeLoader, but its scanner is
+libyaml's, so error messages (and a few malformed-input edge cases) differ.
+Both raise yaml.YAMLError.
+"""
+
+import yaml
+
+_LOADER = getattr(yaml, "CSafeLoader", yaml.SafeLoader)
+
+
+def load(stream):
+    """Parse one YAML document from a str, bytes or open file."""
+    return yaml.load(stream, Loader=_LOADER)
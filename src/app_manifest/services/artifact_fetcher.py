@@ -16,8 +16,6 @@ import tempfile
 from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
 
-import yaml
-
 from app_manifest.models.cyclonedx import (
     CdxAttachment,
     CdxComponent,
@@ -33,6 +31,7 @@ from app_manifest.models.cyclonedx import (
 )
 from app_manifest.models.config import BuildConfig, ComponentConfig, MimeType
 from app_manifest.models.regdef import RegistryDefinition
+from app_manifest.services import _yaml
 from app_manifest.services.purl import make_docker_purl, make_helm_purl, parse_docker_reference
 
 _HELM_TYPES = {MimeType.HELM_CHART}
@@ -278,7 +277,7 @@ def _read_chart_yaml(chart_dir: Path) -> dict:
     """Read Chart.yaml."""
     chart_file = chart_dir / "Chart.yaml"
     with open(chart_file, encoding="utf-8") as f:
-        raw = yaml.safe_load(f)
+        raw = _yaml.load(f)
     if not raw:
         raise ValueError(f"Chart.yaml is empty in {chart_dir}")
     return raw
@@ -1,13 +1,14 @@
 from pathlib import Path
 
-import yaml
-
 from app_manifest.models.config import BuildConfig
+from app_manifest.services import _yaml
+from app_manifest.services._file_cache import stat_cached
 
 
+@stat_cached
 def load_build_config(path: Path) -> BuildConfig:
     with open(path, encoding="utf-8") as f:
-        raw = yaml.safe_load(f)  # YAML → Python dict
+        raw = _yaml.load(f)  # YAML → Python dict
     if not raw:
         raise ValueError(f"Build config file {path} is empty or invalid")
     return BuildConfig.model_validate(raw)  # dict → Pydantic model
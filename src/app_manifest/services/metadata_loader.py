@@ -1,33 +1,60 @@
-import json
+import functools
+import os
+import stat
 from pathlib import Path
 
+from pydantic import TypeAdapter
+
 from app_manifest.models.cyclonedx import CdxComponent
 from app_manifest.models.metadata import ComponentMetadata
+from app_manifest.services import _json
+from app_manifest.services._file_cache import is_racy, stat_cached
 
+_METADATA_LIST = TypeAdapter(list[ComponentMetadata])
 
-def load_component_metadata(path: Path) -> ComponentMetadata:
 
-    with open(path, encoding="utf-8") as f:
-        raw = json.load(f)
+# Metadata and mini-manifests carry free-form values (e.g. property values)
+# into the generated manifest, so they are decoded with exact integers.
+@stat_cached
+def load_component_metadata(path: Path) -> ComponentMetadata:
+    raw = _json.loads_exact(Path(path).read_bytes())
     return ComponentMetadata.model_validate(raw)
 
 
 def _expand_paths(paths: list[Path]) -> list[Path]:
+    # A directory's mtime changes whenever an entry is added, removed or renamed,
+    # so it is enough to invalidate the cached listing.
+    key = tuple((p, os.path.abspath(p), _dir_mtime_ns(p)) for p in paths)
+    if any(mtime_ns is not None and is_racy(mtime_ns) for _, _, mtime_ns in key):
+        return list(_expand_paths_cached.__wrapped__(key))
+    return list(_expand_paths_cached(key))
+
+
+def _dir_mtime_ns(path: Path) -> int | None:
+    try:
+        st = os.stat(path)
+    except OSError:
+        return None
+    return st.st_mtime_ns if stat.S_ISDIR(st.st_mode) else None
+
+
+@functools.lru_cache(maxsize=64)
+def _expand_paths_cached(key: tuple) -> tuple[Path, ...]:
     result = []
-    for p in paths:
-        if p.is_dir():
-            result.extend(sorted(p.glob("*.json")))
-        else:
+    for p, _abspath, mtime_ns in key:
+        if mtime_ns is None:
             result.append(p)
-    return result
+            continue
+        with os.scandir(p) as entries:
+            names = sorted(e.name for e in entries if e.name.endswith(".json") and e.is_file())
+        result.extend(p / name for name in names)
+    return tuple(result)
 
 
 def load_all_metadata(paths: list[Path]) -> dict[str, ComponentMetadata]:
-    result = {}
-    for p in _expand_paths(paths):
-        meta = load_component_metadata(p)
-        result[meta.name] = meta
-    return result
+    # One validation pass over all files; error locations start with the file's index.
+    raws = [_json.loads_exact(p.read_bytes()) for p in _expand_paths(paths)]
+    return {meta.name: meta for meta in _METADATA_LIST.validate_python(raws)}
 
 
 def load_mini_manifest(path: Path) -> CdxComponent:
@@ -35,8 +62,7 @@ def load_mini_manifest(path: Path) -> CdxComponent:
 
     A mini-manifest is a CycloneDX BOM with a single entry in components[].
     """
-    with open(path, encoding="utf-8") as f:
-        raw = json.load(f)
+    raw = _json.loads_exact(Path(path).read_bytes())
 
     components = raw.get("components") or []
     if not components:
@@ -19,10 +19,14 @@ Examples:
     → "pkg:docker/envoyproxy/envoy@v1.32.6?registry_name=docker.io"
 """
 
+import functools
+import re
 from urllib.parse import quote
 
 from app_manifest.models.regdef import RegistryDefinition
 
+_PROTOCOL_RE = re.compile(r"^(?:oci|https?|docker)://")
+
 
 def parse_docker_reference(reference: str) -> tuple[str, str, str]:
     """Parse a Docker reference into its components.
@@ -48,6 +52,13 @@ def make_docker_purl(
     reference — e.g. "ghcr.io/netcracker/jaeger:1.0"
     regdef — Registry Definition for resolving registry_name
     """
+    return _docker_purl(reference, _docker_key(regdef))
+
+
+# PURLs are memoized on the reference plus the regdef fields that decide
+# registry_name (models are unhashable); the same image often recurs.
+@functools.lru_cache(maxsize=4096)
+def _docker_purl(reference: str, key: tuple | None) -> str:
     registry, namespace, name, version = _parse_docker_ref_parts(reference)
 
     if not name:
@@ -55,7 +66,7 @@ def make_docker_purl(
     if not registry:
         raise ValueError(f"Invalid Docker reference: cannot determine registry from '{reference}'")
 
-    registry_name = _resolve_registry_name(registry, "docker", regdef, namespace)
+    registry_name = _docker_registry_name(registry, namespace, key)
 
     if namespace:
         return f"pkg:docker/{namespace}/{name}@{version}?registry_name={registry_name}"
@@ -70,30 +81,27 @@ def _parse_docker_ref_parts(reference: str) -> tuple[str, str, str, str]:
         ref = ref[len("docker://"):]
 
     # Format: REGISTRY_HOST[:PORT]/NAMESPACE/IMAGE:TAG
-    parts = ref.split("/")
+    head, sep, rest = ref.partition("/")
+    path, deep, name_tag = rest.rpartition("/")
 
-    if len(parts) >= 3:
-        registry = parts[0]
-        name_tag = parts[-1]
-        namespace = "/".join(parts[1:-1])
-    elif len(parts) == 2:
-        if "." in parts[0] or ":" in parts[0]:
-            registry = parts[0]
-            namespace = ""
-            name_tag = parts[1]
-        else:
-            registry = "docker.io"
-            namespace = parts[0]
-            name_tag = parts[1]
-    else:
+    if not sep:
         registry = "docker.io"
         namespace = "library"
-        name_tag = parts[0]
+        name_tag = head
+    elif deep:
+        registry = head
+        namespace = path
+    elif "." in head or ":" in head:
+        registry = head
+        namespace = ""
+    else:
+        registry = "docker.io"
+        namespace = head
 
     if ":" in name_tag:
-        name, version = name_tag.rsplit(":", 1)
+        name, _, version = name_tag.rpartition(":")
     elif "@" in name_tag:
-        name, version = name_tag.rsplit("@", 1)
+        name, _, version = name_tag.rpartition("@")
     else:
         name = name_tag
         version = "latest"
@@ -109,6 +117,11 @@ def make_helm_purl(
 
     reference — e.g. "oci://registry.example.com/charts/my-chart:1.0"
     """
+    return _helm_purl(reference, _helm_key(regdef))
+
+
+@functools.lru_cache(maxsize=4096)
+def _helm_purl(reference: str, key: tuple | None) -> str:
     ref = reference
 
     # Strip the protocol prefix
@@ -149,7 +162,7 @@ def make_helm_purl(
     if not registry:
         raise ValueError(f"Invalid Helm reference: cannot determine registry from '{reference}'")
 
-    registry_name = _resolve_registry_name(registry, "helm", regdef)
+    registry_name = _helm_registry_name(registry, key)
 
     if namespace:
         return f"pkg:helm/{namespace}/{name}@{version}?registry_name={registry_name}"
@@ -157,37 +170,48 @@ def make_helm_purl(
         return f"pkg:helm/{name}@{version}?registry_name={registry_name}"
 
 
-def _resolve_registry_name(
-    registry_host: str,
-    artifact_type: str,
-    regdef: RegistryDefinition | None,
-    namespace: str = "",
-) -> str:
-    """Resolve registry_name for PURL qualifier.
+def _docker_key(regdef: RegistryDefinition | None) -> tuple | None:
+    """Hashable (name, uris, group_name) view of the Docker part of *regdef*."""
+    if not regdef:
+        return None
+    dc = regdef.docker_config
+    if not dc:
+        return regdef.name, (), None
+    uris = (dc.group_uri, dc.snapshot_uri, dc.staging_uri, dc.release_uri)
+    return regdef.name, uris, dc.group_name
 
-    Returns regdef.name (URL-encoded) if the host matches a known registry,
-    otherwise falls back to the raw registry hostname.
-    """
+
+def _helm_key(regdef: RegistryDefinition | None) -> tuple | None:
+    """Hashable (name, domain) view of the Helm part of *regdef*."""
     if not regdef:
-        return registry_host
-
-    if artifact_type == "docker" and regdef.docker_config:
-        uris = [
-            regdef.docker_config.group_uri,
-            regdef.docker_config.snapshot_uri,
-            regdef.docker_config.staging_uri,
-            regdef.docker_config.release_uri,
-        ]
-        group_name = regdef.docker_config.group_name
+        return None
+    hc = regdef.helm_app_config
+    return regdef.name, hc.repository_domain_name if hc else None
+
+
+def _docker_registry_name(registry_host: str, namespace: str, key: tuple | None) -> str:
+    """Resolve registry_name for a Docker PURL qualifier.
+
+    Returns the regdef name (URL-encoded) if the host matches one of its
+    URIs and the namespace its groupName, otherwise the raw registry host.
+    """
+    if key:
+        regdef_name, uris, group_name = key
         for uri in uris:
             if uri and _hosts_match(registry_host, uri):
                 if not group_name or _namespace_matches(namespace, group_name):
-                    return quote(regdef.name, safe="")
+                    return quote(regdef_name, safe="")
+
+    # Fallback: return the host itself
+    return registry_host
+
 
-    if artifact_type == "helm" and regdef.helm_app_config:
-        domain = regdef.helm_app_config.repository_domain_name
+def _helm_registry_name(registry_host: str, key: tuple | None) -> str:
+    """Resolve registry_name for a Helm PURL qualifier (see _docker_registry_name)."""
+    if key:
+        regdef_name, domain = key
         if domain and _hosts_match(registry_host, domain):
-            return quote(regdef.name, safe="")
+            return quote(regdef_name, safe="")
 
     # Fallback: return the host itself
     return registry_host
@@ -214,13 +238,12 @@ def _hosts_match(host: str, uri: str) -> bool:
     _hosts_match("ghcr.io", "https://ghcr.io") → True
     _hosts_match("registry.example.com", "oci://registry.example.com") → True
     """
-    clean_uri = uri
-    for prefix in ("oci://", "https://", "http://", "docker://"):
-        if clean_uri.startswith(prefix):
-            clean_uri = clean_uri[len(prefix):]
-            break
+    return host.rstrip("/") == _strip_uri(uri)
 
-    clean_uri = clean_uri.rstrip("/")
-    host = host.rstrip("/")
 
-    return host == clean_uri
+# Registry URIs come from a handful of regdef fields, so the stripped form
+# is cached instead of being recomputed for every component.
+@functools.lru_cache(maxsize=256)
+def _strip_uri(uri: str) -> str:
+    """Drop one leading protocol prefix and trailing slashes from a registry URI."""
+    return _PROTOCOL_RE.sub("", uri, count=1).rstrip("/")
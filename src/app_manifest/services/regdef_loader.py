@@ -5,11 +5,12 @@ Reads a YAML file describing the registry and returns a RegistryDefinition.
 
 from pathlib import Path
 
-import yaml
-
 from app_manifest.models.regdef import RegistryDefinition
+from app_manifest.services import _yaml
+from app_manifest.services._file_cache import stat_cached
 
 
+@stat_cached
 def load_registry_definition(path: Path) -> RegistryDefinition:
     """Read a Registry Definition file.
 
@@ -21,7 +22,7 @@ def load_registry_definition(path: Path) -> RegistryDefinition:
       - `dockerConfig.groupName` is a repo group name, not a Docker namespace — skip namespace matching
     """
     with open(path, encoding="utf-8") as f:
-        raw = yaml.safe_load(f)
+        raw = _yaml.load(f)
     if not raw:
         raise ValueError(f"Registry definition file {path} is empty or invalid")
 
@@ -1,10 +1,14 @@
 """Application Manifest validation against JSON Schema."""
 
+import functools
 import json
 import sys
 from pathlib import Path
 
 import jsonschema
+from jsonschema.protocols import Validator
+from referencing import Registry, Resource
+from referencing.jsonschema import DRAFT7
 
 
 def _schema_path() -> Path:
@@ -14,14 +18,37 @@ def _schema_path() -> Path:
     return Path(__file__).parent.parent / "schemas" / "application-manifest.schema.json"
 
 
+@functools.lru_cache(maxsize=4)
+def _load_schema(path: str) -> dict:
+    """Read and parse a schema file once per path (the result is shared, read-only)."""
+    return json.loads(Path(path).read_text(encoding="utf-8"))
+
+
+@functools.cache
+def _validator() -> Validator:
+    # The bundled schema never changes at runtime: read and build it once.
+    schema = _load_schema(str(_schema_path()))
+    # Pick the draft from "$schema"; constructing the validator never checks
+    # the schema itself, so do that once and not at all under -O.
+    cls = jsonschema.validators.validator_for(schema, default=jsonschema.Draft7Validator)
+    if __debug__:
+        cls.check_schema(schema)
+    # Index the schema and its subschemas up front so "$ref" lookups hit a
+    # prebuilt registry instead of being resolved on the fly.
+    resource = Resource.from_contents(schema, default_specification=DRAFT7)
+    registry = Registry().with_resource(schema.get("$id", ""), resource).crawl()
+    # No FormatChecker: "format" stays an annotation, so the error walk does no
+    # format dispatch. The checks that matter here (serialNumber, hash content)
+    # are "pattern" rules; the only format in the schema is metadata.timestamp.
+    return cls(schema, registry=registry, format_checker=None)
+
+
 def validate_manifest(manifest: dict) -> list[str]:
     """Validate manifest against JSON Schema.
 
     Returns a list of errors (empty if the manifest is valid).
     """
-    schema = json.loads(_schema_path().read_text(encoding="utf-8"))
-    validator = jsonschema.Draft7Validator(schema)
-    errors = sorted(validator.iter_errors(manifest), key=lambda e: list(e.path))
+    errors = sorted(_validator().iter_errors(manifest), key=lambda e: list(e.path))
     return [_format_error(e) for e in errors]
 
 
@@ -0,0 +1,46 @@
+"""Shared pytest fixtures."""
+
+from pathlib import Path
+
+import pytest
+from click.testing import CliRunner
+
+from app_manifest.services import _json, _yaml
+from app_manifest.services.regdef_loader import load_registry_definition
+
+FIXTURES = Path(__file__).parent / "fixtures"
+
+
+@pytest.fixture(scope="session")
+def fixture_cache():
+    """Parsed JSON/YAML input fixtures keyed by Path, read once per session (read-only).
+
+    examples/ is skipped: the e2e tests regenerate files there.
+    """
+    cache = {}
+    for path in sorted(FIXTURES.rglob("*")):
+        if path.parent.name == "examples":
+            continue
+        if path.suffix == ".json":
+            cache[path] = _json.loads(path.read_bytes())
+        elif path.suffix in (".yaml", ".yml"):
+            cache[path] = _yaml.load(path.read_bytes())
+    return cache
+
+
+@pytest.fixture(scope="session")
+def runner():
+    """One CliRunner for the session; each invoke() sets up its own isolation."""
+    return CliRunner()
+
+
+@pytest.fixture(scope="session")
+def qubership_regdef():
+    """qubership Registry Definition, parsed once per session (read-only)."""
+    return load_registry_definition(FIXTURES / "regdefs/qubership_regdef.yml")
+
+
+@pytest.fixture(scope="session")
+def sandbox_regdef():
+    """sandbox Registry Definition, parsed once per session (read-only)."""
+    return load_registry_definition(FIXTURES / "regdefs/sandbox_regdef.yml")
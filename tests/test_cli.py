@@ -4,6 +4,7 @@ import tarfile
 from pathlib import Path
 from unittest.mock import patch, MagicMock
 
+import pytest
 import yaml
 from click.testing import CliRunner
 
@@ -282,6 +283,7 @@ class TestGenerateEndToEnd:
         assert len(data["components"]) == 4
 
 
+@pytest.mark.xdist_group("jaeger_example")
 class TestFullPipelineEndToEnd:
     """Full pipeline: component → fetch → generate."""
 
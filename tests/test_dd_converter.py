@@ -1,6 +1,8 @@
 """Tests for DD ↔ AMv2 conversion."""
 
 import json
+import uuid
+from datetime import datetime, timezone
 from pathlib import Path
 
 import pytest
@@ -11,7 +13,7 @@ from app_manifest.models.dd import DeploymentDescriptor, DdService, DdChart
 from app_manifest.models.regdef import RegistryDefinition, DockerConfig, HelmAppConfig
 from app_manifest.models.cyclonedx import (
     CdxComponent, CdxHash, CdxProperty, CycloneDxBom,
-    CdxMetadata, CdxMetadataComponent, CdxTool, CdxToolsWrapper,
+    CdxMetadata, CdxMetadataComponent, CdxTool, CdxToolsWrapper, _make_bom_ref,
 )
 from app_manifest.services.dd_converter import (
     convert_dd_to_amv2,
@@ -22,6 +24,7 @@ from app_manifest.services.dd_converter import (
 )
 from app_manifest.services.config_loader import load_build_config
 from app_manifest.services.regdef_loader import load_registry_definition
+from app_manifest.services.validator import validate_manifest
 
 FIXTURES = Path(__file__).parent / "fixtures"
 DD_FIXTURES = FIXTURES / "dd"
@@ -352,8 +355,6 @@ def _make_simple_bom(
         components=[service_chart_comp],
     )
 
-    import uuid
-    from datetime import datetime, timezone
     return CycloneDxBom(
         serial_number=f"urn:uuid:{uuid.uuid4()}",
         metadata=CdxMetadata(
@@ -421,9 +422,6 @@ class TestConvertAmv2ToDd:
 
     def test_standalone_not_in_services(self, artifactory_regdef):
         """standalone-runnable components must NOT appear in DD services."""
-        from app_manifest.models.cyclonedx import _make_bom_ref
-        import uuid
-        from datetime import datetime, timezone
 
         standalone = CdxComponent(
             bom_ref=_make_bom_ref("my-app"),
@@ -446,8 +444,6 @@ class TestConvertAmv2ToDd:
 
     def test_bom_without_app_chart(self, artifactory_regdef):
         """AMv2 with no app-chart → DD with empty charts[]."""
-        import uuid
-        from datetime import datetime, timezone
 
         docker_comp = CdxComponent(
             bom_ref="docker-img",
@@ -577,7 +573,6 @@ class TestE2EConvertAndValidate:
             "--version", "0.0.0-release-2025.4-20251120.144057-26",
         ])
 
-        import json
         data = json.loads(out_file.read_text(encoding="utf-8"))
 
         assert data["bomFormat"] == "CycloneDX"
@@ -640,7 +635,6 @@ class TestE2EConvertAndValidate:
         ])
         assert result.exit_code == 0, f"AMv2→DD failed:\n{result.output}"
 
-        import json
         original = json.loads(
             (DD_FIXTURES / "cloud_integration_platform_dd.json").read_text(encoding="utf-8")
         )
@@ -668,9 +662,6 @@ class TestE2EFullRealDd:
     APP_VERSION = "0.0.0-release-2025.4-20251120.144057-26"
 
     def _convert(self):
-        from app_manifest.services.config_loader import load_build_config
-        from app_manifest.services.regdef_loader import load_registry_definition
-
         dd_raw = json.loads(self.DD_FULL.read_text(encoding="utf-8"))
         dd = DeploymentDescriptor.model_validate(dd_raw)
         config = load_build_config(self.CONFIG_FULL)
@@ -742,7 +733,6 @@ class TestE2EFullRealDd:
 
     def test_produces_valid_manifest(self):
         """The produced AMv2 must pass JSON Schema validation."""
-        from app_manifest.services.validator import validate_manifest
         bom, _ = self._convert()
         bom_dict = bom.model_dump(by_alias=True, exclude_none=True)
         errors = validate_manifest(bom_dict)
@@ -769,8 +759,6 @@ class TestE2EFullRealDd:
 
     def test_roundtrip_preserves_all_services(self, tmp_path):
         """DD → AMv2 → DD: all 8 full_image_names preserved."""
-        from app_manifest.services.config_loader import load_build_config
-        from app_manifest.services.regdef_loader import load_registry_definition
 
         dd_raw = json.loads(self.DD_FULL.read_text(encoding="utf-8"))
         dd_original = DeploymentDescriptor.model_validate(dd_raw)
@@ -810,8 +798,6 @@ class TestFullCycleRoundTrip:
     APP_VERSION = "0.0.0-release-2025.4-20251120.144057-26"
 
     def _load(self):
-        from app_manifest.services.config_loader import load_build_config
-        from app_manifest.services.regdef_loader import load_registry_definition
         dd_raw = json.loads(self.DD_FULL.read_text(encoding="utf-8"))
         return (
             DeploymentDescriptor.model_validate(dd_raw),
@@ -820,7 +806,6 @@ class TestFullCycleRoundTrip:
         )
 
     def _assert_amv2_valid(self, bom, step: str):
-        from app_manifest.services.validator import validate_manifest
         bom_dict = bom.model_dump(by_alias=True, exclude_none=True)
         errors = validate_manifest(bom_dict)
         assert errors == [], f"[{step}] AMv2 validation failed: {errors}"
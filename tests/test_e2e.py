@@ -7,6 +7,7 @@ Covers:
 - Full pipeline: component → fetch → generate for monitoring-platform
 """
 
+import base64
 import json
 import tarfile
 import io
@@ -275,7 +276,6 @@ class TestComponentMetadataVariations:
 
     def test_nested_components_from_ci_metadata(self, tmp_path):
         """Helm from CI can contain nested components (values.schema.json)."""
-        import base64
         schema_b64 = base64.b64encode(b'{"type":"object"}').decode()
         data = self._run_component(tmp_path, {
             "name": "platform-chart",
@@ -573,6 +573,7 @@ class TestFullPipelineMonitoring:
 # 5. Jaeger: real config with 11 docker images, helm chart, and validation
 # ─────────────────────────────────────────────────────────────────────────────
 
+@pytest.mark.xdist_group("jaeger_example")
 class TestJaegerFullPipeline:
     """Full pipeline for jaeger_full_config.yaml.
 
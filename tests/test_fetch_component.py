@@ -5,15 +5,18 @@ and a fake .tgz with Chart.yaml and values.schema.json is created.
 """
 
 import base64
+import io
 import json
 import tarfile
 from pathlib import Path
 from unittest.mock import patch, MagicMock
 
 import pytest
+import yaml
 from click.testing import CliRunner
 
 from app_manifest.cli import cli
+from app_manifest.models.config import ComponentConfig, MimeType
 from app_manifest.services.artifact_fetcher import (
     fetch_helm_component,
     fetch_components_from_config,
@@ -22,6 +25,7 @@ from app_manifest.services.artifact_fetcher import (
     _extract_nested_components,
     _read_chart_yaml,
 )
+from app_manifest.services.config_loader import load_build_config
 
 FIXTURES = Path(__file__).parent / "fixtures"
 
@@ -30,8 +34,6 @@ def _create_fake_chart_tgz(dest_dir: Path, chart_name="my-chart", version="1.0.0
                             app_version="1.0.0", with_schema=True,
                             with_profiles=True) -> Path:
     """Create a fake Helm chart .tgz for tests."""
-    import io
-    import yaml
 
     tgz_path = dest_dir / f"{chart_name}-{version}.tgz"
 
@@ -145,11 +147,10 @@ class TestExtractNestedComponents:
 
 class TestReadChartYaml:
     def test_reads_chart_yaml(self, tmp_path):
-        import yaml as pyyaml
         chart_dir = tmp_path / "my-chart"
         chart_dir.mkdir()
         (chart_dir / "Chart.yaml").write_text(
-            pyyaml.dump({"name": "test", "version": "1.0"})
+            yaml.dump({"name": "test", "version": "1.0"})
         )
         data = _read_chart_yaml(chart_dir)
         assert data["name"] == "test"
@@ -197,15 +198,12 @@ class TestFetchHelmComponent:
         assert comp.components is not None
         assert len(comp.components) == 2  # values.schema.json + resource-profiles
 
-    def test_purl_with_regdef(self, tmp_path):
-        from app_manifest.services.regdef_loader import load_registry_definition
-
+    def test_purl_with_regdef(self, tmp_path, qubership_regdef):
         ref = "oci://registry.qubership.org/charts/my-chart:1.0.0"
-        regdef = load_registry_definition(FIXTURES / "regdefs/qubership_regdef.yml")
 
         with patch("app_manifest.services.artifact_fetcher.subprocess.run") as mock_run:
             mock_run.side_effect = self._mock_subprocess(ref, tmp_path)
-            bom = fetch_helm_component(ref, regdef)
+            bom = fetch_helm_component(ref, qubership_regdef)
 
         comp = bom.components[0]
         assert comp.purl is not None
@@ -240,7 +238,6 @@ class TestFetchFromConfig:
 
     def test_fetches_helm_and_docker_with_reference(self, tmp_path):
         """fetch_components_from_config processes helm charts and docker images with a reference."""
-        from app_manifest.services.config_loader import load_build_config
         config = load_build_config(FIXTURES / "configs/minimal_config.yaml")
 
         with patch("app_manifest.services.artifact_fetcher.subprocess.run") as mock_run:
@@ -256,7 +253,6 @@ class TestFetchFromConfig:
 
     def test_skips_components_without_reference(self, tmp_path):
         """Components without reference (standalone) are not included in results."""
-        from app_manifest.services.config_loader import load_build_config
         config = load_build_config(FIXTURES / "configs/minimal_config.yaml")
 
         with patch("app_manifest.services.artifact_fetcher.subprocess.run") as mock_run:
@@ -328,7 +324,6 @@ class TestFetchCLI:
 
     def test_no_helm_references_in_config(self, tmp_path):
         """Config with no references — print message, exit 0."""
-        import yaml
         config_path = tmp_path / "empty_config.yaml"
         config_path.write_text(yaml.dump({
             "applicationVersion": "1.0.0",
@@ -403,7 +398,6 @@ class TestFetchDuplicateNameWarning:
     def test_duplicate_name_uses_vendor_suffix(self, tmp_path):
         """Components with the same name but different mimeType each get a unique
         filename with a vendor suffix derived from mimeType, and a warning in stderr."""
-        import yaml
         config_path = tmp_path / "dup_config.yaml"
         config_path.write_text(yaml.dump({
             "applicationVersion": "1.0.0",
@@ -456,7 +450,6 @@ class TestFetchDockerFromReference:
     """Tests for fetch_docker_component_from_reference."""
 
     def _make_docker_config(self, name: str, reference: str, mime_type: str = "application/vnd.docker.image"):
-        from app_manifest.models.config import ComponentConfig, MimeType
         return ComponentConfig(
             name=name,
             mimeType=MimeType(mime_type),
@@ -494,12 +487,9 @@ class TestFetchDockerFromReference:
         assert c.purl is not None
         assert "registry_id=sandbox.example.com" in c.purl
 
-    def test_purl_with_regdef(self):
-        from app_manifest.services.regdef_loader import load_registry_definition
-        regdef = load_registry_definition(FIXTURES / "regdefs/sandbox_regdef.yml")
-
+    def test_purl_with_regdef(self, sandbox_regdef):
         comp = self._make_docker_config("jaeger", "sandbox.example.com/core/jaeger:build3")
-        bom = fetch_docker_component_from_reference(comp, regdef)
+        bom = fetch_docker_component_from_reference(comp, sandbox_regdef)
 
         c = bom.components[0]
         # registry_name must be the name from regdef, not the host
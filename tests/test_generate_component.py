@@ -1,110 +1,188 @@
 """Tests for the component command and component_builder service."""
 
 import json
+import re
 from pathlib import Path
 
+import click
 import pytest
-from click.testing import CliRunner
+from pydantic import TypeAdapter
 
 from app_manifest.cli import cli
 from app_manifest.models.metadata import ComponentMetadata
 from app_manifest.services.component_builder import build_component_manifest
 
 FIXTURES = Path(__file__).parent / "fixtures"
+DOCKER_META = FIXTURES / "metadata/docker_metadata.json"
+HELM_META = FIXTURES / "metadata/helm_metadata.json"
+QUBERSHIP_REGDEF = FIXTURES / "regdefs/qubership_regdef.yml"
+
+# pkg:<type>/[<namespace>/]<name>@<version>?<qualifier>=<registry>
+_PURL_RE = re.compile(
+    r"pkg:(?P<type>[^/]+)/(?:(?P<ns>.+)/)?(?P<name>[^/@]+)"
+    r"@(?P<ver>[^?]+)\?(?P<qualifier>[^=]+)=(?P<reg>.+)"
+)
+
+
+def assert_purl(purl, **expected):
+    """Match *purl* once against _PURL_RE and compare the named groups."""
+    m = _PURL_RE.fullmatch(purl or "")
+    assert m, purl
+    for key, value in expected.items():
+        assert m[key] == value, f"{key}: {m[key]!r} != {value!r} in {purl}"
+
+
+# Built once at import so every test reuses the same compiled validator.
+_META_TA = TypeAdapter(ComponentMetadata)
+
+# The `component` command resolved through the CLI group once at import;
+# tests call its callback instead of re-parsing arguments per invocation.
+_CMD = cli.get_command(click.Context(cli), "component")
+
+# Metadata documents are serialized once at import so each test validates
+# straight from JSON (validate_json) instead of building a dict first.
+DOCKER_BASIC = json.dumps({
+    "name": "jaeger",
+    "type": "container",
+    "mime-type": "application/vnd.docker.image",
+    "group": "core",
+    "version": "build3",
+    "hashes": [{"alg": "SHA-256", "content": "abc123"}],
+    "reference": "sandbox.example.com/core/jaeger:build3",
+})
+DOCKER_SANDBOX_REF = json.dumps({
+    "name": "jaeger",
+    "type": "container",
+    "mime-type": "application/vnd.docker.image",
+    "reference": "sandbox.example.com/core/jaeger:build3",
+})
+DOCKER_GHCR_REF = json.dumps({
+    "name": "jaeger",
+    "type": "container",
+    "mime-type": "application/vnd.docker.image",
+    "group": "core",
+    "reference": "ghcr.io/netcracker/jaeger:build3",
+})
+DOCKER_TWO_HASHES = json.dumps({
+    "name": "jaeger",
+    "type": "container",
+    "mime-type": "application/vnd.docker.image",
+    "hashes": [
+        {"alg": "SHA-256", "content": "aaa"},
+        {"alg": "SHA-512", "content": "bbb"},
+    ],
+})
+DOCKER_NO_REF = json.dumps({
+    "name": "jaeger",
+    "type": "container",
+    "mime-type": "application/vnd.docker.image",
+})
+HELM_BASIC = json.dumps({
+    "name": "qubership-jaeger",
+    "type": "application",
+    "mime-type": "application/vnd.nc.helm.chart",
+    "version": "1.2.3",
+    "appVersion": "1.2.3",
+    "reference": "oci://registry.qubership.org/charts/qubership-jaeger:1.2.3",
+})
+HELM_OCI_REF = json.dumps({
+    "name": "qubership-jaeger",
+    "type": "application",
+    "mime-type": "application/vnd.nc.helm.chart",
+    "reference": "oci://registry.qubership.org/charts/qubership-jaeger:1.2.3",
+})
+HELM_APP_VERSION = json.dumps({
+    "name": "my-chart",
+    "type": "application",
+    "mime-type": "application/vnd.nc.helm.chart",
+    "version": "0.1.0",
+    "appVersion": "2.0.0",
+})
+HELM_NO_NESTED = json.dumps({
+    "name": "simple-chart",
+    "type": "application",
+    "mime-type": "application/vnd.nc.helm.chart",
+    "version": "1.0.0",
+})
+DOCKER_MINIMAL = json.dumps({
+    "name": "test",
+    "type": "container",
+    "mime-type": "application/vnd.docker.image",
+})
 
 
 # ─── component_builder service tests ───────────────────────────
 
 
+@pytest.fixture(scope="class")
+def docker_basic_bom():
+    """DOCKER_BASIC mini-manifest, built once per test class."""
+    return build_component_manifest(_META_TA.validate_json(DOCKER_BASIC))
+
+
+@pytest.fixture(scope="class")
+def minimal_bom():
+    """DOCKER_MINIMAL mini-manifest, built once per test class."""
+    return build_component_manifest(_META_TA.validate_json(DOCKER_MINIMAL))
+
+
 class TestBuildDockerComponent:
     """Mini-manifest for a Docker image."""
 
-    def test_docker_basic_fields(self):
-        """Basic fields of a Docker component."""
-        meta = ComponentMetadata.model_validate({
-            "name": "jaeger",
-            "type": "container",
-            "mime-type": "application/vnd.docker.image",
-            "group": "core",
-            "version": "build3",
-            "hashes": [{"alg": "SHA-256", "content": "abc123"}],
-            "reference": "sandbox.example.com/core/jaeger:build3",
-        })
-        bom = build_component_manifest(meta)
-        data = bom.model_dump(by_alias=True, exclude_none=True)
+    def test_docker_bom_fields(self, docker_basic_bom):
+        """Root fields of a Docker mini-manifest."""
+        bom = docker_basic_bom
 
-        assert data["bomFormat"] == "CycloneDX"
-        assert data["specVersion"] == "1.6"
-        assert len(data["components"]) == 1
-        assert data["dependencies"] == []
+        assert bom.bom_format == "CycloneDX"
+        assert bom.spec_version == "1.6"
+        assert len(bom.components) == 1
+        assert bom.dependencies == []
 
-        comp = data["components"][0]
-        assert comp["name"] == "jaeger"
-        assert comp["type"] == "container"
-        assert comp["mime-type"] == "application/vnd.docker.image"
-        assert comp["group"] == "core"
-        assert comp["version"] == "build3"
-        assert "bom-ref" in comp
-        assert comp["bom-ref"].startswith("jaeger:")
+    def test_docker_basic_fields(self, docker_basic_bom):
+        """Basic fields of a Docker component."""
+        comp = docker_basic_bom.components[0]
+
+        assert comp.name == "jaeger"
+        assert comp.type == "container"
+        assert comp.mime_type == "application/vnd.docker.image"
+        assert comp.group == "core"
+        assert comp.version == "build3"
+        assert comp.bom_ref.startswith("jaeger:")
 
     def test_docker_purl_without_regdef(self):
         """PURL is built with the host as registry_name."""
-        meta = ComponentMetadata.model_validate({
-            "name": "jaeger",
-            "type": "container",
-            "mime-type": "application/vnd.docker.image",
-            "reference": "sandbox.example.com/core/jaeger:build3",
-        })
-        bom = build_component_manifest(meta)
-        comp = bom.model_dump(by_alias=True, exclude_none=True)["components"][0]
-
-        assert comp["purl"] == "pkg:docker/core/jaeger@build3?registry_id=sandbox.example.com"
-
-    def test_docker_purl_with_regdef(self):
-        """PURL with regdef — registry_name taken from regdef."""
-        from app_manifest.services.regdef_loader import load_registry_definition
+        meta = _META_TA.validate_json(DOCKER_SANDBOX_REF)
+        comp = build_component_manifest(meta).components[0]
 
-        meta = ComponentMetadata.model_validate({
-            "name": "jaeger",
-            "type": "container",
-            "mime-type": "application/vnd.docker.image",
-            "group": "core",
-            "reference": "ghcr.io/netcracker/jaeger:build3",
-        })
-        regdef = load_registry_definition(FIXTURES / "regdefs/qubership_regdef.yml")
-        bom = build_component_manifest(meta, regdef)
-        comp = bom.model_dump(by_alias=True, exclude_none=True)["components"][0]
+        assert_purl(
+            comp.purl, type="docker", ns="core", name="jaeger", ver="build3",
+            qualifier="registry_id", reg="sandbox.example.com",
+        )
+
+    def test_docker_purl_with_regdef(self, qubership_regdef):
+        """PURL with regdef — registry_name taken from regdef."""
+        meta = _META_TA.validate_json(DOCKER_GHCR_REF)
+        comp = build_component_manifest(meta, qubership_regdef).components[0]
 
-        assert comp["purl"] == "pkg:docker/netcracker/jaeger@build3?registry_id=ghcr.io"
+        assert_purl(
+            comp.purl, type="docker", ns="netcracker", name="jaeger", ver="build3",
+            qualifier="registry_id", reg="ghcr.io",
+        )
 
     def test_docker_hashes(self):
         """Hashes are passed through to the mini-manifest."""
-        meta = ComponentMetadata.model_validate({
-            "name": "jaeger",
-            "type": "container",
-            "mime-type": "application/vnd.docker.image",
-            "hashes": [
-                {"alg": "SHA-256", "content": "aaa"},
-                {"alg": "SHA-512", "content": "bbb"},
-            ],
-        })
-        bom = build_component_manifest(meta)
-        comp = bom.model_dump(by_alias=True, exclude_none=True)["components"][0]
-
-        assert len(comp["hashes"]) == 2
-        assert comp["hashes"][0] == {"alg": "SHA-256", "content": "aaa"}
+        meta = _META_TA.validate_json(DOCKER_TWO_HASHES)
+        comp = build_component_manifest(meta).components[0]
+
+        assert len(comp.hashes) == 2
+        assert (comp.hashes[0].alg, comp.hashes[0].content) == ("SHA-256", "aaa")
 
     def test_docker_without_reference_no_purl(self):
         """Without reference — no PURL."""
-        meta = ComponentMetadata.model_validate({
-            "name": "jaeger",
-            "type": "container",
-            "mime-type": "application/vnd.docker.image",
-        })
-        bom = build_component_manifest(meta)
-        comp = bom.model_dump(by_alias=True, exclude_none=True)["components"][0]
+        meta = _META_TA.validate_json(DOCKER_NO_REF)
+        comp = build_component_manifest(meta).components[0]
 
-        assert "purl" not in comp
+        assert comp.purl is None
 
 
 class TestBuildHelmComponent:
@@ -112,208 +190,140 @@ class TestBuildHelmComponent:
 
     def test_helm_basic_fields(self):
         """Basic fields of a Helm component."""
-        meta = ComponentMetadata.model_validate({
-            "name": "qubership-jaeger",
-            "type": "application",
-            "mime-type": "application/vnd.nc.helm.chart",
-            "version": "1.2.3",
-            "appVersion": "1.2.3",
-            "reference": "oci://registry.qubership.org/charts/qubership-jaeger:1.2.3",
-        })
-        bom = build_component_manifest(meta)
-        comp = bom.model_dump(by_alias=True, exclude_none=True)["components"][0]
-
-        assert comp["name"] == "qubership-jaeger"
-        assert comp["type"] == "application"
-        assert comp["mime-type"] == "application/vnd.nc.helm.chart"
-        assert comp["version"] == "1.2.3"
-        assert comp["bom-ref"].startswith("qubership-jaeger:")
-
-    def test_helm_purl_with_regdef(self):
-        """PURL for Helm with regdef."""
-        from app_manifest.services.regdef_loader import load_registry_definition
+        meta = _META_TA.validate_json(HELM_BASIC)
+        comp = build_component_manifest(meta).components[0]
 
-        meta = ComponentMetadata.model_validate({
-            "name": "qubership-jaeger",
-            "type": "application",
-            "mime-type": "application/vnd.nc.helm.chart",
-            "reference": "oci://registry.qubership.org/charts/qubership-jaeger:1.2.3",
-        })
-        regdef = load_registry_definition(FIXTURES / "regdefs/qubership_regdef.yml")
-        bom = build_component_manifest(meta, regdef)
-        comp = bom.model_dump(by_alias=True, exclude_none=True)["components"][0]
+        assert comp.name == "qubership-jaeger"
+        assert comp.type == "application"
+        assert comp.mime_type == "application/vnd.nc.helm.chart"
+        assert comp.version == "1.2.3"
+        assert comp.bom_ref.startswith("qubership-jaeger:")
+
+    def test_helm_purl_with_regdef(self, qubership_regdef):
+        """PURL for Helm with regdef."""
+        meta = _META_TA.validate_json(HELM_OCI_REF)
+        comp = build_component_manifest(meta, qubership_regdef).components[0]
 
-        assert comp["purl"] == "pkg:helm/charts/qubership-jaeger@1.2.3?registry_id=registry.qubership.org"
+        assert_purl(
+            comp.purl, type="helm", ns="charts", name="qubership-jaeger", ver="1.2.3",
+            qualifier="registry_id", reg="registry.qubership.org",
+        )
 
     def test_helm_version_from_app_version(self):
         """appVersion takes precedence over version."""
-        meta = ComponentMetadata.model_validate({
-            "name": "my-chart",
-            "type": "application",
-            "mime-type": "application/vnd.nc.helm.chart",
-            "version": "0.1.0",
-            "appVersion": "2.0.0",
-        })
-        bom = build_component_manifest(meta)
-        comp = bom.model_dump(by_alias=True, exclude_none=True)["components"][0]
-
-        assert comp["version"] == "2.0.0"
+        meta = _META_TA.validate_json(HELM_APP_VERSION)
+        comp = build_component_manifest(meta).components[0]
+
+        assert comp.version == "2.0.0"
 
     def test_helm_nested_components(self):
         """Nested components (values.schema.json, resource-profiles)."""
-        with open(FIXTURES / "metadata/helm_metadata.json") as f:
-            raw = json.load(f)
-        meta = ComponentMetadata.model_validate(raw)
-        bom = build_component_manifest(meta)
-        comp = bom.model_dump(by_alias=True, exclude_none=True)["components"][0]
+        meta = _META_TA.validate_json(HELM_META.read_bytes())
+        comp = build_component_manifest(meta).components[0]
 
-        assert "components" in comp
-        assert len(comp["components"]) == 2
+        assert comp.components is not None
+        assert len(comp.components) == 2
 
         # values.schema.json component
-        schema_comp = comp["components"][0]
-        assert schema_comp["name"] == "values.schema.json"
-        assert schema_comp["type"] == "data"
-        assert schema_comp["mime-type"] == "application/vnd.nc.helm.values.schema"
-        assert len(schema_comp["data"]) == 1
+        schema_comp = comp.components[0]
+        assert schema_comp.name == "values.schema.json"
+        assert schema_comp.type == "data"
+        assert schema_comp.mime_type == "application/vnd.nc.helm.values.schema"
+        assert len(schema_comp.data) == 1
 
         # resource-profile-baselines component
-        profiles_comp = comp["components"][1]
-        assert profiles_comp["name"] == "resource-profile-baselines"
-        assert len(profiles_comp["data"]) == 2
+        profiles_comp = comp.components[1]
+        assert profiles_comp.name == "resource-profile-baselines"
+        assert len(profiles_comp.data) == 2
 
     def test_helm_without_nested_components(self):
         """Helm without nested components."""
-        meta = ComponentMetadata.model_validate({
-            "name": "simple-chart",
-            "type": "application",
-            "mime-type": "application/vnd.nc.helm.chart",
-            "version": "1.0.0",
-        })
-        bom = build_component_manifest(meta)
-        comp = bom.model_dump(by_alias=True, exclude_none=True)["components"][0]
+        meta = _META_TA.validate_json(HELM_NO_NESTED)
+        comp = build_component_manifest(meta).components[0]
 
-        assert "components" not in comp
+        assert comp.components is None
 
 
 class TestMiniManifestStructure:
     """General structure checks for mini-manifests."""
 
-    def test_has_metadata_section(self):
+    def test_has_metadata_section(self, minimal_bom):
         """Mini-manifest contains metadata with tool info."""
-        meta = ComponentMetadata.model_validate({
-            "name": "test",
-            "type": "container",
-            "mime-type": "application/vnd.docker.image",
-        })
-        bom = build_component_manifest(meta)
-        data = bom.model_dump(by_alias=True, exclude_none=True)
+        data = minimal_bom.model_dump(by_alias=True, exclude_none=True)
 
         assert "metadata" in data
         assert data["metadata"]["component"]["name"] == "am-build-cli"
         assert data["metadata"]["tools"]["components"][0]["name"] == "am-build-cli"
 
-    def test_serial_number_is_urn_uuid(self):
+    def test_serial_number_is_urn_uuid(self, minimal_bom):
         """serialNumber follows the urn:uuid:... format."""
-        meta = ComponentMetadata.model_validate({
-            "name": "test",
-            "type": "container",
-            "mime-type": "application/vnd.docker.image",
-        })
-        bom = build_component_manifest(meta)
-        data = bom.model_dump(by_alias=True, exclude_none=True)
-
-        assert data["serialNumber"].startswith("urn:uuid:")
+        assert minimal_bom.serial_number.startswith("urn:uuid:")
 
 
 # ─── component CLI command tests ──────────────────────
 
 
-class TestGenerateComponentCLI:
-    """End-to-end tests for the component CLI command."""
+@pytest.fixture(scope="module")
+def cli_out_dir(tmp_path_factory):
+    """Output directory shared by the CLI tests of this module."""
+    return tmp_path_factory.mktemp("cli_out")
 
-    def test_help(self):
-        """Help is displayed."""
-        runner = CliRunner()
-        result = runner.invoke(cli, ["component", "--help"])
-        assert result.exit_code == 0
-        assert "--input" in result.output
-        assert "--out" in result.output
-        assert "--registry-def" in result.output
-
-    def test_docker_metadata(self, tmp_path):
-        """Generate a mini-manifest for Docker."""
-        out_file = tmp_path / "component.json"
-        runner = CliRunner()
-        result = runner.invoke(cli, [
-            "component",
-            "-i", str(FIXTURES / "metadata/docker_metadata.json"),
-            "-o", str(out_file),
-        ])
-        assert result.exit_code == 0, result.output
-        assert out_file.exists()
 
-        with open(out_file, encoding="utf-8") as f:
-            data = json.load(f)
+class TestGenerateComponentCLI:
+    """End-to-end tests for the component CLI command.
+
+    Tests that only check the generated mini-manifest call the resolved
+    command's callback directly; the shared runner covers help and `-o -` parsing.
+    """
+
+    @pytest.mark.parametrize("args, expected", [
+        (["component", "--help"], ["--input", "--out", "--registry-def"]),
+        (["--help"], ["component"]),
+    ], ids=["component-help", "root-help"])
+    def test_help(self, runner, args, expected):
+        """Help is displayed; the component command is visible in the root help."""
+        result = runner.invoke(cli, args)
+        assert result.exit_code == 0
+        for needle in expected:
+            assert needle in result.output
+
+    @pytest.mark.parametrize(
+        "metadata_file, regdef_file, expected_name, expected_type, expected_purl, expected_nested",
+        [
+            (DOCKER_META, None, "jaeger", "container",
+             {"type": "docker", "name": "jaeger"}, 0),
+            (HELM_META, QUBERSHIP_REGDEF, "qubership-jaeger", "application",
+             {"type": "helm", "qualifier": "registry_id", "reg": "registry.qubership.org"}, 2),
+            (HELM_META, None, "qubership-jaeger", "application",
+             {"type": "helm", "qualifier": "registry_id", "reg": "registry.qubership.org"}, 2),
+        ],
+        ids=["docker", "helm-with-regdef", "helm-without-regdef"],
+    )
+    def test_component_output(
+        self, capsys, metadata_file, regdef_file,
+        expected_name, expected_type, expected_purl, expected_nested,
+    ):
+        """Docker and Helm metadata produce a single-component mini-manifest."""
+        _CMD.callback(input_file=metadata_file, out=Path("-"), registry_def=regdef_file)
+        data = json.loads(capsys.readouterr().out)
 
         assert data["bomFormat"] == "CycloneDX"
         assert len(data["components"]) == 1
-        assert data["components"][0]["name"] == "jaeger"
-        assert data["components"][0]["type"] == "container"
-        assert "purl" in data["components"][0]
-
-    def test_helm_metadata_with_regdef(self, tmp_path):
-        """Generate a mini-manifest for Helm with regdef."""
-        out_file = tmp_path / "component.json"
-        runner = CliRunner()
-        result = runner.invoke(cli, [
-            "component",
-            "-i", str(FIXTURES / "metadata/helm_metadata.json"),
-            "-r", str(FIXTURES / "regdefs/qubership_regdef.yml"),
-            "-o", str(out_file),
-        ])
-        assert result.exit_code == 0, result.output
-
-        with open(out_file, encoding="utf-8") as f:
-            data = json.load(f)
-
         comp = data["components"][0]
-        assert comp["name"] == "qubership-jaeger"
-        assert "registry_id=registry.qubership.org" in comp["purl"]
-        assert len(comp["components"]) == 2
-
-    def test_helm_metadata_without_regdef(self, tmp_path):
-        """Generate a mini-manifest for Helm without regdef — host is used as registry_name."""
-        out_file = tmp_path / "component.json"
-        runner = CliRunner()
-        result = runner.invoke(cli, [
-            "component",
-            "-i", str(FIXTURES / "metadata/helm_metadata.json"),
-            "-o", str(out_file),
-        ])
+        assert comp["name"] == expected_name
+        assert comp["type"] == expected_type
+        assert_purl(comp["purl"], **expected_purl)
+        assert len(comp.get("components", [])) == expected_nested
+
+    def test_stdout_through_click(self, runner):
+        """`-o -` passes Click's path check and prints only the JSON."""
+        result = runner.invoke(cli, ["component", "-i", str(DOCKER_META), "-o", "-"])
         assert result.exit_code == 0, result.output
+        assert "written to" not in result.output
+        assert json.loads(result.output)["components"][0]["name"] == "jaeger"
 
-        with open(out_file, encoding="utf-8") as f:
-            data = json.load(f)
-
-        comp = data["components"][0]
-        assert "registry_id=registry.qubership.org" in comp["purl"]
-
-    def test_creates_parent_dirs(self, tmp_path):
+    def test_creates_parent_dirs(self, cli_out_dir):
         """Creates parent directories for the output file."""
-        out_file = tmp_path / "sub" / "dir" / "component.json"
-        runner = CliRunner()
-        result = runner.invoke(cli, [
-            "component",
-            "-i", str(FIXTURES / "metadata/docker_metadata.json"),
-            "-o", str(out_file),
-        ])
-        assert result.exit_code == 0, result.output
+        out_file = cli_out_dir / "sub" / "dir" / "component.json"
+        _CMD.callback(input_file=DOCKER_META, out=out_file, registry_def=None)
         assert out_file.exists()
-
-    def test_shows_in_root_help(self):
-        """The component command is visible in the root help."""
-        runner = CliRunner()
-        result = runner.invoke(cli, ["--help"])
-        assert result.exit_code == 0
-        assert "component" in result.output
@@ -6,67 +6,136 @@ not raw CI metadata.
 
 from pathlib import Path
 
+import pytest
+
+from app_manifest.models.metadata import ComponentMetadata
+from app_manifest.services import _json
 from app_manifest.services.component_builder import build_component_manifest
 from app_manifest.services.config_loader import load_build_config
 from app_manifest.services.manifest_builder import build_manifest
-from app_manifest.services.metadata_loader import load_component_metadata
-from app_manifest.services.regdef_loader import load_registry_definition
 
 FIXTURES = Path(__file__).parent / "fixtures"
+MINIMAL_CFG = FIXTURES / "configs/minimal_config.yaml"
+QIP_CFG = FIXTURES / "configs/qip_config.yaml"
+DOCKER_META = FIXTURES / "metadata/docker_metadata.json"
+HELM_META = FIXTURES / "metadata/helm_metadata.json"
+ENVOY_META = FIXTURES / "metadata/envoy_metadata.json"
+QIP_HELM_META = FIXTURES / "metadata/qip_helm_metadata.json"
+QIP_ENGINE_META = FIXTURES / "metadata/qip_engine_metadata.json"
+QIP_RUNTIME_CATALOG_META = FIXTURES / "metadata/qip_runtime_catalog_metadata.json"
+
 
+def _make_mini_manifests(parsed_metadata, regdef=None):
+    """Build a dict of mini-manifests from pre-parsed metadata.
 
-def _make_mini_manifests(metadata_files, regdef=None):
-    """Build a dict of mini-manifests from metadata files."""
+    *parsed_metadata* maps a metadata file path to its parsed JSON.
+    """
     result = {}
-    for path in metadata_files:
-        meta = load_component_metadata(path)
-        bom = build_component_manifest(meta, regdef)
-        comp = bom.components[0]
-        key = (comp.name, comp.mime_type)
-        result[key] = comp
+    for raw in parsed_metadata.values():
+        meta = ComponentMetadata.model_validate(raw)
+        comp = build_component_manifest(meta, regdef).components[0]
+        result[(comp.name, comp.mime_type)] = comp
     return result
 
 
+def _props(comp):
+    """Properties of *comp* keyed by name."""
+    return {p.name: p for p in comp.properties or []}
+
+
+@pytest.fixture(scope="session")
+def parsed_metadata(fixture_cache):
+    """Parsed metadata JSON by Path; file reading is covered in test_metadata."""
+    return {p: raw for p, raw in fixture_cache.items() if p.parent.name == "metadata"}
+
+
+@pytest.fixture(scope="session")
+def built_manifests(qubership_regdef, parsed_metadata):
+    """Return build(config, metadata_files) → (bom, mini), memoized per session."""
+    cache = {}
+
+    def build(config_path, metadata_files):
+        key = (config_path, tuple(metadata_files))
+        if key not in cache:
+            mini = _make_mini_manifests(
+                {p: parsed_metadata[p] for p in metadata_files}, qubership_regdef,
+            )
+            bom, _ = build_manifest(load_build_config(config_path), mini)
+            cache[key] = (bom, mini)
+        return cache[key]
+
+    return build
+
+
+# Each test class declares CONFIG and METADATA_FILES; classes declaring the
+# same inputs share one BOM for the whole session. Tests must not mutate it.
+@pytest.fixture(scope="class")
+def built(request, built_manifests):
+    return built_manifests(request.cls.CONFIG, request.cls.METADATA_FILES)
+
+
+@pytest.fixture(scope="class")
+def mini(built):
+    return built[1]
+
+
+@pytest.fixture(scope="class")
+def bom(built):
+    return built[0]
+
+
+@pytest.fixture(scope="class")
+def bom_dict(bom):
+    """JSON form of *bom*, shared by the class (read-only)."""
+    return _json.loads(bom.model_dump_json(by_alias=True, exclude_none=True))
+
+
+@pytest.fixture(scope="class")
+def index(bom):
+    """Lookup tables over *bom* and its Helm chart, built once per class."""
+    by_mime = {c.mime_type: c for c in bom.components}
+    helm = by_mime.get("application/vnd.nc.helm.chart")
+    return {
+        "by_mime": by_mime,
+        "by_ref_dep": {d.ref: d for d in bom.dependencies},
+        "containers": {c.name: c for c in bom.components if c.type == "container"},
+        "helm_children": {c.name: c for c in helm.components or []} if helm else {},
+    }
+
+
+@pytest.fixture(scope="class")
+def helm(index):
+    return index["by_mime"]["application/vnd.nc.helm.chart"]
+
+
 class TestBuildManifestMinimal:
     """Tests with a minimal config (jaeger-like)."""
 
-    def _build(self):
-        config = load_build_config(FIXTURES / "configs/minimal_config.yaml")
-        regdef = load_registry_definition(FIXTURES / "regdefs/qubership_regdef.yml")
-        mini = _make_mini_manifests([
-            FIXTURES / "metadata/docker_metadata.json",
-            FIXTURES / "metadata/helm_metadata.json",
-            FIXTURES / "metadata/envoy_metadata.json",
-        ], regdef)
-        bom, _ = build_manifest(config, mini)
-        return bom
-
-    def test_bom_root_fields(self):
+    CONFIG = MINIMAL_CFG
+    METADATA_FILES = [DOCKER_META, HELM_META, ENVOY_META]
+
+    def test_bom_root_fields(self, bom):
         """Root BOM fields."""
-        bom = self._build()
         assert bom.bom_format == "CycloneDX"
         assert bom.spec_version == "1.6"
         assert bom.version == 1
         assert bom.serial_number.startswith("urn:uuid:")
 
-    def test_metadata(self):
+    def test_metadata(self, bom):
         """Metadata section."""
-        bom = self._build()
         assert bom.metadata.component.name == "qubership-jaeger"
         assert bom.metadata.component.version == "1.2.3"
         assert bom.metadata.component.type == "application"
         assert bom.metadata.component.mime_type == "application/vnd.nc.application"
         assert bom.metadata.tools.components[0].name == "am-build-cli"
 
-    def test_components_count(self):
+    def test_components_count(self, bom):
         """Number of components from config."""
-        bom = self._build()
         # minimal_config.yaml: standalone + helm + 2 docker = 4
         assert len(bom.components) == 4
 
-    def test_standalone_component(self):
+    def test_standalone_component(self, bom):
         """Standalone-runnable component."""
-        bom = self._build()
         standalone = bom.components[0]
         assert standalone.type == "application"
         assert standalone.mime_type == "application/vnd.nc.standalone-runnable"
@@ -74,11 +143,9 @@ class TestBuildManifestMinimal:
         assert standalone.properties == []
         assert standalone.components == []
 
-    def test_docker_component(self):
+    def test_docker_component(self, index):
         """Docker image taken from a mini-manifest."""
-        bom = self._build()
-        docker_comps = [c for c in bom.components if c.type == "container"]
-        jaeger = next(c for c in docker_comps if c.name == "jaeger")
+        jaeger = index["containers"]["jaeger"]
 
         assert jaeger.type == "container"
         assert jaeger.mime_type == "application/vnd.docker.image"
@@ -89,53 +156,42 @@ class TestBuildManifestMinimal:
         assert jaeger.hashes is not None
         assert len(jaeger.hashes) == 1
 
-    def test_docker_purl_from_mini_manifest(self):
+    def test_docker_purl_from_mini_manifest(self, index):
         """PURL is taken from the mini-manifest as-is."""
-        bom = self._build()
-        docker_comps = [c for c in bom.components if c.type == "container"]
-        jaeger = next(c for c in docker_comps if c.name == "jaeger")
+        jaeger = index["containers"]["jaeger"]
 
         assert jaeger.purl is not None
         assert "jaeger" in jaeger.purl
         assert "build3" in jaeger.purl
 
-    def test_envoy_from_mini_manifest(self):
+    def test_envoy_from_mini_manifest(self, index):
         """Envoy taken from a mini-manifest."""
-        bom = self._build()
-        docker_comps = [c for c in bom.components if c.type == "container"]
-        envoy = next(c for c in docker_comps if c.name == "envoy")
+        envoy = index["containers"]["envoy"]
 
         assert envoy.version == "v1.32.6"
         assert envoy.purl is not None
         assert "envoy" in envoy.purl
 
-    def test_dependencies_app_depends_on_all(self):
+    def test_dependencies_app_depends_on_all(self, bom):
         """The application depends on all components."""
-        bom = self._build()
         app_dep = bom.dependencies[0]
 
         assert app_dep.ref == bom.metadata.component.bom_ref
         assert len(app_dep.depends_on) == 4
 
-    def test_dependencies_standalone_depends_on_helm(self):
+    def test_dependencies_standalone_depends_on_helm(self, bom, index):
         """Standalone depends on helm (from dependsOn in YAML)."""
-        bom = self._build()
         standalone_ref = bom.components[0].bom_ref
 
-        standalone_dep = next(
-            (d for d in bom.dependencies if d.ref == standalone_ref), None
-        )
+        standalone_dep = index["by_ref_dep"].get(standalone_ref)
         assert standalone_dep is not None
         assert len(standalone_dep.depends_on) == 1
 
-    def test_dependencies_helm_depends_on_docker(self):
+    def test_dependencies_helm_depends_on_docker(self, bom, index):
         """Helm depends on Docker images (from dependsOn in YAML)."""
-        bom = self._build()
         helm_ref = bom.components[1].bom_ref
 
-        helm_dep = next(
-            (d for d in bom.dependencies if d.ref == helm_ref), None
-        )
+        helm_dep = index["by_ref_dep"].get(helm_ref)
         assert helm_dep is not None
         assert len(helm_dep.depends_on) == 2
 
@@ -143,61 +199,35 @@ class TestBuildManifestMinimal:
 class TestHelmComponent:
     """Tests for a Helm chart component."""
 
-    def _build(self):
-        config = load_build_config(FIXTURES / "configs/minimal_config.yaml")
-        regdef = load_registry_definition(FIXTURES / "regdefs/qubership_regdef.yml")
-        mini = _make_mini_manifests([
-            FIXTURES / "metadata/docker_metadata.json",
-            FIXTURES / "metadata/helm_metadata.json",
-            FIXTURES / "metadata/envoy_metadata.json",
-        ], regdef)
-        bom, _ = build_manifest(config, mini)
-        return bom
-
-    def _helm_comp(self):
-        bom = self._build()
-        return next(
-            c for c in bom.components
-            if c.mime_type == "application/vnd.nc.helm.chart"
-        )
+    CONFIG = MINIMAL_CFG
+    METADATA_FILES = [DOCKER_META, HELM_META, ENVOY_META]
 
-    def test_helm_basic_fields(self):
+    def test_helm_basic_fields(self, helm):
         """Helm: type, mime-type, and name fields."""
-        helm = self._helm_comp()
         assert helm.type == "application"
         assert helm.mime_type == "application/vnd.nc.helm.chart"
         assert helm.name == "qubership-jaeger"
 
-    def test_helm_version(self):
+    def test_helm_version(self, helm):
         """Version taken from the mini-manifest."""
-        helm = self._helm_comp()
         assert helm.version == "1.2.3"
 
-    def test_helm_purl(self):
+    def test_helm_purl(self, helm):
         """PURL taken from the mini-manifest."""
-        helm = self._helm_comp()
         assert helm.purl is not None
         assert "pkg:helm/" in helm.purl
         assert "qubership-jaeger" in helm.purl
 
-    def test_helm_is_library_property(self):
+    def test_helm_is_library_property(self, helm):
         """isLibrary property is added by generate."""
-        helm = self._helm_comp()
         assert helm.properties is not None
-        is_library = next(
-            p for p in helm.properties if p.name == "isLibrary"
-        )
+        is_library = _props(helm)["isLibrary"]
         assert is_library.value is False
 
-    def test_helm_artifact_mappings(self):
+    def test_helm_artifact_mappings(self, helm):
         """artifactMappings maps Docker → valuesPathPrefix."""
-        helm = self._helm_comp()
         assert helm.properties is not None
-        mappings_prop = next(
-            (p for p in helm.properties
-             if p.name == "nc:helm.values.artifactMappings"),
-            None,
-        )
+        mappings_prop = _props(helm).get("nc:helm.values.artifactMappings")
         assert mappings_prop is not None
         assert len(mappings_prop.value) == 2
 
@@ -205,35 +235,21 @@ class TestHelmComponent:
         assert "images.jaeger" in prefixes
         assert "images.envoy" in prefixes
 
-    def test_helm_artifact_mappings_keys_are_bom_refs(self):
+    def test_helm_artifact_mappings_keys_are_bom_refs(self, helm, index):
         """Keys in artifactMappings are bom-refs of Docker components."""
-        bom = self._build()
-        helm = next(
-            c for c in bom.components
-            if c.mime_type == "application/vnd.nc.helm.chart"
-        )
         assert helm.properties is not None
-        mappings_prop = next(
-            p for p in helm.properties
-            if p.name == "nc:helm.values.artifactMappings"
-        )
+        mappings_prop = _props(helm)["nc:helm.values.artifactMappings"]
 
-        docker_refs = {
-            c.bom_ref for c in bom.components if c.type == "container"
-        }
+        docker_refs = {c.bom_ref for c in index["containers"].values()}
         for key in mappings_prop.value:
             assert key in docker_refs, f"Key {key} is not a Docker bom-ref"
 
-    def test_helm_nested_values_schema(self):
+    def test_helm_nested_values_schema(self, helm, index):
         """Nested component values.schema.json."""
-        helm = self._helm_comp()
         assert helm.components is not None
         assert len(helm.components) >= 1
 
-        schema_comp = next(
-            (c for c in helm.components if c.name == "values.schema.json"),
-            None,
-        )
+        schema_comp = index["helm_children"].get("values.schema.json")
         assert schema_comp is not None
         assert schema_comp.type == "data"
         assert schema_comp.mime_type == "application/vnd.nc.helm.values.schema"
@@ -242,30 +258,25 @@ class TestHelmComponent:
         assert schema_comp.data[0].name == "values.schema.json"
         assert schema_comp.data[0].contents.attachment.encoding == "base64"
 
-    def test_helm_nested_resource_profiles(self):
+    def test_helm_nested_resource_profiles(self, helm, index):
         """Nested component resource-profile-baselines."""
-        helm = self._helm_comp()
         assert helm.components is not None
-        profiles_comp = next(
-            (c for c in helm.components if c.name == "resource-profile-baselines"),
-            None,
-        )
+        profiles_comp = index["helm_children"].get("resource-profile-baselines")
         assert profiles_comp is not None
         assert profiles_comp.type == "data"
         assert profiles_comp.mime_type == "application/vnd.nc.resource-profile-baseline"
         assert profiles_comp.data is not None
         assert len(profiles_comp.data) == 2
 
-    def test_helm_hashes(self):
+    def test_helm_hashes(self, helm):
         """Hashes taken from the mini-manifest."""
-        helm = self._helm_comp()
         assert helm.hashes is not None
         assert len(helm.hashes) == 1
         assert helm.hashes[0].alg == "SHA-256"
 
     def test_helm_without_mini_manifest(self):
         """Helm without a mini-manifest — skipped."""
-        config = load_build_config(FIXTURES / "configs/minimal_config.yaml")
+        config = load_build_config(MINIMAL_CFG)
         bom, _ = build_manifest(config, {})
         helm_comps = [
             c for c in bom.components
@@ -275,18 +286,16 @@ class TestHelmComponent:
 
     def test_missing_mini_manifest_produces_warning(self):
         """If a mini-manifest is not found — a warning is returned."""
-        config = load_build_config(FIXTURES / "configs/minimal_config.yaml")
+        config = load_build_config(MINIMAL_CFG)
         _, warnings = build_manifest(config, {})
         # Config has a helm-chart — it will not find a mini-manifest
         assert any("not found in mini-manifests" in w for w in warnings)
         assert any("qubership-jaeger" in w for w in warnings)
 
-    def test_helm_serialization(self):
+    def test_helm_serialization(self, bom_dict):
         """Helm component serializes correctly to JSON."""
-        bom = self._build()
-        data = bom.model_dump(by_alias=True, exclude_none=True)
         helm_data = next(
-            c for c in data["components"]
+            c for c in bom_dict["components"]
             if c["mime-type"] == "application/vnd.nc.helm.chart"
         )
         assert "bom-ref" in helm_data
@@ -295,25 +304,11 @@ class TestHelmComponent:
         assert "components" in helm_data
         assert len(helm_data["components"]) == 2
 
-    def test_bom_ref_regenerated(self):
+    def test_bom_ref_regenerated(self, mini, helm):
         """bom-ref is regenerated by generate (option B)."""
-        config = load_build_config(FIXTURES / "configs/minimal_config.yaml")
-        regdef = load_registry_definition(FIXTURES / "regdefs/qubership_regdef.yml")
-        mini = _make_mini_manifests([
-            FIXTURES / "metadata/docker_metadata.json",
-            FIXTURES / "metadata/helm_metadata.json",
-            FIXTURES / "metadata/envoy_metadata.json",
-        ], regdef)
-
         helm_key = ("qubership-jaeger", "application/vnd.nc.helm.chart")
         original_ref = mini[helm_key].bom_ref
 
-        bom, _ = build_manifest(config, mini)
-        helm = next(
-            c for c in bom.components
-            if c.mime_type == "application/vnd.nc.helm.chart"
-        )
-
         assert helm.bom_ref != original_ref
         assert helm.bom_ref.startswith("qubership-jaeger:")
 
@@ -322,17 +317,17 @@ class TestBuildManifestOverrides:
     """Tests for version and name overrides."""
 
     def test_version_override(self):
-        config = load_build_config(FIXTURES / "configs/minimal_config.yaml")
+        config = load_build_config(MINIMAL_CFG)
         bom, _ = build_manifest(config, {}, version_override="9.9.9")
         assert bom.metadata.component.version == "9.9.9"
 
     def test_name_override(self):
-        config = load_build_config(FIXTURES / "configs/minimal_config.yaml")
+        config = load_build_config(MINIMAL_CFG)
         bom, _ = build_manifest(config, {}, name_override="custom-name")
         assert bom.metadata.component.name == "custom-name"
 
     def test_no_override_uses_config(self):
-        config = load_build_config(FIXTURES / "configs/minimal_config.yaml")
+        config = load_build_config(MINIMAL_CFG)
         bom, _ = build_manifest(config, {})
         assert bom.metadata.component.name == "qubership-jaeger"
         assert bom.metadata.component.version == "1.2.3"
@@ -341,165 +336,101 @@ class TestBuildManifestOverrides:
 class TestUmbrellaHelm:
     """Tests for the umbrella (app-chart) pattern — QIP."""
 
-    def _build(self):
-        config = load_build_config(FIXTURES / "configs/qip_config.yaml")
-        regdef = load_registry_definition(FIXTURES / "regdefs/qubership_regdef.yml")
-        mini = _make_mini_manifests([
-            FIXTURES / "metadata/qip_helm_metadata.json",
-            FIXTURES / "metadata/qip_engine_metadata.json",
-            FIXTURES / "metadata/qip_runtime_catalog_metadata.json",
-        ], regdef)
-        bom, _ = build_manifest(config, mini)
-        return bom
-
-    def test_top_level_components_count(self):
+    CONFIG = QIP_CFG
+    METADATA_FILES = [QIP_HELM_META, QIP_ENGINE_META, QIP_RUNTIME_CATALOG_META]
+
+    def test_top_level_components_count(self, bom):
         """Top-level: standalone + app-chart + 2 docker = 4 (sub-charts are NOT at the top level)."""
-        bom = self._build()
         assert len(bom.components) == 4
 
-    def test_sub_charts_not_at_top_level(self):
+    def test_sub_charts_not_at_top_level(self, bom):
         """Sub-charts (qip-engine, qip-runtime-catalog) are NOT at the top level."""
-        bom = self._build()
         top_names = [(c.name, c.mime_type) for c in bom.components]
         assert ("qip-engine", "application/vnd.nc.helm.chart") not in top_names
         assert ("qip-runtime-catalog", "application/vnd.nc.helm.chart") not in top_names
 
-    def test_sub_charts_nested_in_app_chart(self):
+    def test_sub_charts_nested_in_app_chart(self, index):
         """Sub-charts are nested inside the app-chart."""
-        bom = self._build()
-        app_chart = next(
-            c for c in bom.components
-            if c.mime_type == "application/vnd.nc.helm.chart"
-        )
+        app_chart = index["by_mime"]["application/vnd.nc.helm.chart"]
         assert app_chart.components is not None
         nested_names = [c.name for c in app_chart.components]
         assert "qip-engine" in nested_names
         assert "qip-runtime-catalog" in nested_names
 
-    def test_sub_chart_has_artifact_mapping(self):
+    def test_sub_chart_has_artifact_mapping(self, index):
         """Each sub-chart has its own artifactMapping."""
-        bom = self._build()
-        app_chart = next(
-            c for c in bom.components
-            if c.mime_type == "application/vnd.nc.helm.chart"
-        )
+        app_chart = index["by_mime"]["application/vnd.nc.helm.chart"]
         assert app_chart.components is not None
         for sub in app_chart.components:
             if sub.mime_type != "application/vnd.nc.helm.chart":
                 continue
             assert sub.properties is not None
-            mappings_prop = next(
-                (p for p in sub.properties
-                 if p.name == "nc:helm.values.artifactMappings"),
-                None,
-            )
+            mappings_prop = _props(sub).get("nc:helm.values.artifactMappings")
             assert mappings_prop is not None, f"{sub.name} has no artifactMappings"
             assert len(mappings_prop.value) == 1
 
-    def test_sub_chart_artifact_mapping_keys_are_docker_refs(self):
+    def test_sub_chart_artifact_mapping_keys_are_docker_refs(self, index):
         """Keys in sub-chart artifactMappings are bom-refs of Docker components."""
-        bom = self._build()
-        docker_refs = {
-            c.bom_ref for c in bom.components if c.type == "container"
-        }
-        app_chart = next(
-            c for c in bom.components
-            if c.mime_type == "application/vnd.nc.helm.chart"
-        )
+        docker_refs = {c.bom_ref for c in index["containers"].values()}
+        app_chart = index["by_mime"]["application/vnd.nc.helm.chart"]
         assert app_chart.components is not None
         for sub in app_chart.components:
             if sub.mime_type != "application/vnd.nc.helm.chart":
                 continue
             assert sub.properties is not None
-            mappings_prop = next(
-                p for p in sub.properties
-                if p.name == "nc:helm.values.artifactMappings"
-            )
+            mappings_prop = _props(sub)["nc:helm.values.artifactMappings"]
             for key in mappings_prop.value:
                 assert key in docker_refs
 
-    def test_app_chart_no_artifact_mappings(self):
+    def test_app_chart_no_artifact_mappings(self, index):
         """App-chart (umbrella) has no artifactMappings (its deps are sub-charts, not docker)."""
-        bom = self._build()
-        app_chart = next(
-            c for c in bom.components
-            if c.mime_type == "application/vnd.nc.helm.chart"
-        )
+        app_chart = index["by_mime"]["application/vnd.nc.helm.chart"]
         assert app_chart.properties is not None
-        mappings_prop = next(
-            (p for p in app_chart.properties
-             if p.name == "nc:helm.values.artifactMappings"),
-            None,
-        )
+        mappings_prop = _props(app_chart).get("nc:helm.values.artifactMappings")
         assert mappings_prop is None
 
-    def test_standalone_depends_on_app_chart(self):
+    def test_standalone_depends_on_app_chart(self, index):
         """Standalone depends on the app-chart."""
-        bom = self._build()
-        standalone = next(
-            c for c in bom.components
-            if c.mime_type == "application/vnd.nc.standalone-runnable"
-        )
-        app_chart = next(
-            c for c in bom.components
-            if c.mime_type == "application/vnd.nc.helm.chart"
-        )
-        standalone_dep = next(
-            d for d in bom.dependencies if d.ref == standalone.bom_ref
-        )
+        standalone = index["by_mime"]["application/vnd.nc.standalone-runnable"]
+        app_chart = index["by_mime"]["application/vnd.nc.helm.chart"]
+        standalone_dep = index["by_ref_dep"][standalone.bom_ref]
         assert app_chart.bom_ref in standalone_dep.depends_on
 
-    def test_sub_chart_depends_on_docker(self):
+    def test_sub_chart_depends_on_docker(self, index):
         """Sub-chart → docker image in dependencies."""
-        bom = self._build()
-        app_chart = next(
-            c for c in bom.components
-            if c.mime_type == "application/vnd.nc.helm.chart"
-        )
-        docker_refs = {
-            c.bom_ref for c in bom.components if c.type == "container"
-        }
+        app_chart = index["by_mime"]["application/vnd.nc.helm.chart"]
+        docker_refs = {c.bom_ref for c in index["containers"].values()}
         assert app_chart.components is not None
         for sub in app_chart.components:
             if sub.mime_type != "application/vnd.nc.helm.chart":
                 continue
-            sub_dep = next(
-                (d for d in bom.dependencies if d.ref == sub.bom_ref),
-                None,
-            )
+            sub_dep = index["by_ref_dep"].get(sub.bom_ref)
             assert sub_dep is not None, f"No dependency for sub-chart {sub.name}"
             for ref in sub_dep.depends_on:
                 assert ref in docker_refs
 
-    def test_metadata_depends_on_top_level_only(self):
+    def test_metadata_depends_on_top_level_only(self, bom):
         """Metadata (app) depends only on top-level components."""
-        bom = self._build()
         app_dep = bom.dependencies[0]
         assert app_dep.ref == bom.metadata.component.bom_ref
         # standalone + app-chart + 2 docker = 4
         assert len(app_dep.depends_on) == 4
 
-    def test_sub_chart_is_library_false(self):
+    def test_sub_chart_is_library_false(self, index):
         """Sub-charts have isLibrary=false."""
-        bom = self._build()
-        app_chart = next(
-            c for c in bom.components
-            if c.mime_type == "application/vnd.nc.helm.chart"
-        )
+        app_chart = index["by_mime"]["application/vnd.nc.helm.chart"]
         assert app_chart.components is not None
         for sub in app_chart.components:
             if sub.mime_type != "application/vnd.nc.helm.chart":
                 continue
             assert sub.properties is not None
-            is_lib = next(p for p in sub.properties if p.name == "isLibrary")
+            is_lib = _props(sub)["isLibrary"]
             assert is_lib.value is False
 
-    def test_serialization(self):
+    def test_serialization(self, bom_dict):
         """Umbrella manifest serializes correctly."""
-        bom = self._build()
-        data = bom.model_dump(by_alias=True, exclude_none=True)
         app_chart = next(
-            c for c in data["components"]
+            c for c in bom_dict["components"]
             if c["mime-type"] == "application/vnd.nc.helm.chart"
         )
         nested_charts = [
@@ -1,14 +1,32 @@
 """Tests for JSON metadata models and the metadata loader."""
 
+import json
+import os
+import shutil
 from pathlib import Path
 
 import pytest
 from pydantic import ValidationError
 
 from app_manifest.models.metadata import ComponentMetadata, HashEntry
-from app_manifest.services.metadata_loader import _expand_paths, load_all_metadata, load_component_metadata
+from app_manifest.services.metadata_loader import (
+    _expand_paths,
+    load_all_metadata,
+    load_component_metadata,
+    load_mini_manifest,
+)
 
 FIXTURES = Path(__file__).parent / "fixtures"
+DOCKER_META = FIXTURES / "metadata/docker_metadata.json"
+HELM_META = FIXTURES / "metadata/helm_metadata.json"
+
+
+def _stage(src: Path, dst: Path) -> None:
+    """Place a read-only fixture at *dst*: hard link, copy across devices."""
+    try:
+        os.link(src, dst)
+    except OSError:
+        shutil.copy(src, dst)
 
 
 class TestHashEntry:
@@ -52,6 +70,16 @@ class TestComponentMetadata:
         assert meta.hashes == []
         assert meta.reference is None
 
+    def test_metadata_is_frozen(self):
+        """Metadata is read-only after validation."""
+        meta = ComponentMetadata.model_validate({
+            "name": "my-chart",
+            "type": "application",
+            "mime-type": "application/vnd.nc.helm.chart",
+        })
+        with pytest.raises(ValidationError):
+            meta.version = "1.0.0"
+
     def test_missing_name_raises_error(self):
         """Metadata without a name — raises an error."""
         with pytest.raises(ValidationError):
@@ -66,7 +94,7 @@ class TestMetadataLoader:
 
     def test_load_docker_metadata(self):
         """Load Docker metadata from a file."""
-        meta = load_component_metadata(FIXTURES / "metadata/docker_metadata.json")
+        meta = load_component_metadata(DOCKER_META)
         assert meta.name == "jaeger"
         assert meta.type == "container"
         assert meta.group == "core"
@@ -76,7 +104,7 @@ class TestMetadataLoader:
 
     def test_load_helm_metadata(self):
         """Load Helm metadata from a file."""
-        meta = load_component_metadata(FIXTURES / "metadata/helm_metadata.json")
+        meta = load_component_metadata(HELM_META)
         assert meta.name == "qubership-jaeger"
         assert meta.type == "application"
         assert meta.reference == "oci://registry.qubership.org/charts/qubership-jaeger:1.2.3"
@@ -84,8 +112,8 @@ class TestMetadataLoader:
     def test_load_all_metadata(self):
         """Loading multiple files — result is a dict keyed by name."""
         paths = [
-            FIXTURES / "metadata/docker_metadata.json",
-            FIXTURES / "metadata/helm_metadata.json",
+            DOCKER_META,
+            HELM_META,
         ]
         result = load_all_metadata(paths)
 
@@ -100,11 +128,60 @@ class TestMetadataLoader:
         with pytest.raises(FileNotFoundError):
             load_component_metadata(Path("nonexistent.json"))
 
+    @pytest.mark.parametrize("payload", [
+        b'\xef\xbb\xbf{"name": "a", "type": "container", "mime-type": "x"}',
+        b'{"name": "a", "type": "container", "mime-type": "x", "version": NaN}',
+    ], ids=["bom", "nan"])
+    def test_load_rejects_non_strict_json(self, tmp_path, payload):
+        """Metadata is held to strict JSON."""
+        path = tmp_path / "meta.json"
+        path.write_bytes(payload)
+        with pytest.raises(json.JSONDecodeError):
+            load_component_metadata(path)
+
+    def test_mini_manifest_keeps_wide_integers(self, tmp_path):
+        """Integers wider than 64 bits reach the component unchanged, orjson or not."""
+        path = tmp_path / "mini.json"
+        path.write_text(json.dumps({"components": [{
+            "bom-ref": "img:1",
+            "type": "container",
+            "mime-type": "application/vnd.docker.image",
+            "name": "a",
+            "properties": [{"name": "big", "value": 2**70}],
+        }]}), encoding="utf-8")
+
+        value = load_mini_manifest(path).properties[0].value
+        assert type(value) is int and value == 2**70
+
+    def test_load_returns_independent_copies(self):
+        """Repeated loads of the same file do not share model instances."""
+        first = load_component_metadata(DOCKER_META)
+        second = load_component_metadata(DOCKER_META)
+        assert first == second
+        assert first is not second
+        assert first.hashes[0] is not second.hashes[0]
+
+    def test_load_rereads_changed_file(self, tmp_path):
+        """A file is parsed once per (mtime, size); a new mtime forces a re-read."""
+        past_ns = 1_000_000_000 * 1_000_000_000  # outside the racy window
+        path = tmp_path / "meta.json"
+        doc = '{"name": "%s", "type": "container", "mime-type": "application/vnd.docker.image"}'
+        path.write_text(doc % "a", encoding="utf-8")
+        os.utime(path, ns=(past_ns, past_ns))
+        assert load_component_metadata(path).name == "a"
+
+        # Same size and mtime: served from the cache without reading the file.
+        path.write_text(doc % "b", encoding="utf-8")
+        os.utime(path, ns=(past_ns, past_ns))
+        assert load_component_metadata(path).name == "a"
+
+        os.utime(path, ns=(past_ns + 1, past_ns + 1))
+        assert load_component_metadata(path).name == "b"
+
     def test_load_all_metadata_from_directory(self, tmp_path):
         """Directory instead of a file — all *.json inside are loaded."""
-        import shutil
-        shutil.copy(FIXTURES / "metadata/docker_metadata.json", tmp_path / "docker_metadata.json")
-        shutil.copy(FIXTURES / "metadata/helm_metadata.json", tmp_path / "helm_metadata.json")
+        _stage(DOCKER_META, tmp_path / "docker_metadata.json")
+        _stage(HELM_META, tmp_path / "helm_metadata.json")
 
         result = load_all_metadata([tmp_path])
 
@@ -114,11 +191,10 @@ class TestMetadataLoader:
 
     def test_load_all_metadata_mixed(self, tmp_path):
         """Both files and directories can be passed together."""
-        import shutil
-        shutil.copy(FIXTURES / "metadata/helm_metadata.json", tmp_path / "helm_metadata.json")
+        _stage(HELM_META, tmp_path / "helm_metadata.json")
 
         result = load_all_metadata([
-            FIXTURES / "metadata/docker_metadata.json",
+            DOCKER_META,
             tmp_path,
         ])
 
@@ -136,15 +212,14 @@ class TestExpandPaths:
 
     def test_file_stays_as_is(self):
         """A file path is returned unchanged."""
-        paths = [FIXTURES / "metadata/docker_metadata.json"]
+        paths = [DOCKER_META]
         result = _expand_paths(paths)
-        assert result == [FIXTURES / "metadata/docker_metadata.json"]
+        assert result == [DOCKER_META]
 
     def test_directory_expands_to_json_files(self, tmp_path):
         """A directory expands to its *.json files."""
-        import shutil
-        shutil.copy(FIXTURES / "metadata/docker_metadata.json", tmp_path / "a.json")
-        shutil.copy(FIXTURES / "metadata/helm_metadata.json", tmp_path / "b.json")
+        _stage(DOCKER_META, tmp_path / "a.json")
+        _stage(HELM_META, tmp_path / "b.json")
 
         result = _expand_paths([tmp_path])
         assert len(result) == 2
@@ -152,8 +227,7 @@ class TestExpandPaths:
 
     def test_directory_ignores_non_json(self, tmp_path):
         """Non-JSON files in a directory are ignored."""
-        import shutil
-        shutil.copy(FIXTURES / "metadata/docker_metadata.json", tmp_path / "meta.json")
+        _stage(DOCKER_META, tmp_path / "meta.json")
         (tmp_path / "notes.txt").write_text("ignore me")
 
         result = _expand_paths([tmp_path])
@@ -162,9 +236,8 @@ class TestExpandPaths:
 
     def test_directory_files_sorted(self, tmp_path):
         """Files from a directory are returned in alphabetical order."""
-        import shutil
-        shutil.copy(FIXTURES / "metadata/helm_metadata.json", tmp_path / "z.json")
-        shutil.copy(FIXTURES / "metadata/docker_metadata.json", tmp_path / "a.json")
+        _stage(HELM_META, tmp_path / "z.json")
+        _stage(DOCKER_META, tmp_path / "a.json")
 
         result = _expand_paths([tmp_path])
         assert result[0].name == "a.json"
@@ -172,11 +245,21 @@ class TestExpandPaths:
 
     def test_mixed_files_and_directories(self, tmp_path):
         """Mix of files and directories."""
-        import shutil
-        shutil.copy(FIXTURES / "metadata/helm_metadata.json", tmp_path / "helm.json")
+        _stage(HELM_META, tmp_path / "helm.json")
 
         result = _expand_paths([
-            FIXTURES / "metadata/docker_metadata.json",
+            DOCKER_META,
             tmp_path,
         ])
         assert len(result) == 2
+
+    def test_directory_listing_refreshed_after_change(self, tmp_path):
+        """A cached listing is dropped once the directory mtime changes."""
+        past_ns = 1_000_000_000 * 1_000_000_000
+        _stage(DOCKER_META, tmp_path / "a.json")
+        os.utime(tmp_path, ns=(past_ns, past_ns))
+        assert [p.name for p in _expand_paths([tmp_path])] == ["a.json"]
+
+        _stage(HELM_META, tmp_path / "b.json")
+        os.utime(tmp_path, ns=(past_ns + 1, past_ns + 1))
+        assert [p.name for p in _expand_paths([tmp_path])] == ["a.json", "b.json"]
@@ -65,16 +65,14 @@ class TestRegistryDefinition:
 class TestDockerPurl:
     """Tests for Docker PURL generation."""
 
-    def test_ghcr_with_regdef(self):
+    def test_ghcr_with_regdef(self, qubership_regdef):
         """ghcr.io → registry_id=ghcr.io (raw hostname)."""
-        regdef = load_registry_definition(FIXTURES / "regdefs/qubership_regdef.yml")
-        purl = make_docker_purl("ghcr.io/netcracker/jaeger:1.0", regdef)
+        purl = make_docker_purl("ghcr.io/netcracker/jaeger:1.0", qubership_regdef)
         assert purl == "pkg:docker/netcracker/jaeger@1.0?registry_id=ghcr.io"
 
-    def test_docker_hub(self):
+    def test_docker_hub(self, qubership_regdef):
         """docker.io with namespace — regdef does not match, falls back to host."""
-        regdef = load_registry_definition(FIXTURES / "regdefs/qubership_regdef.yml")
-        purl = make_docker_purl("docker.io/envoyproxy/envoy:v1.32.6", regdef)
+        purl = make_docker_purl("docker.io/envoyproxy/envoy:v1.32.6", qubership_regdef)
         assert purl == "pkg:docker/envoyproxy/envoy@v1.32.6?registry_id=docker.io"
 
     def test_docker_hub_short(self):
@@ -82,21 +80,19 @@ class TestDockerPurl:
         purl = make_docker_purl("docker.io/openjdk:11")
         assert purl == "pkg:docker/openjdk@11?registry_id=docker.io"
 
-    def test_aws_ecr_with_regdef(self):
+    def test_aws_ecr_with_regdef(self, sandbox_regdef):
         """AWS ECR → registry_id=raw hostname."""
-        regdef = load_registry_definition(FIXTURES / "regdefs/sandbox_regdef.yml")
         purl = make_docker_purl(
             "123456789.dkr.ecr.eu-west-1.amazonaws.com/docker/jaeger:build3",
-            regdef,
+            sandbox_regdef,
         )
         assert purl == "pkg:docker/docker/jaeger@build3?registry_id=123456789.dkr.ecr.eu-west-1.amazonaws.com"
 
-    def test_aws_ecr_namespace_mismatch(self):
+    def test_aws_ecr_namespace_mismatch(self, sandbox_regdef):
         """AWS ECR with an unrecognized namespace — falls back to host."""
-        regdef = load_registry_definition(FIXTURES / "regdefs/sandbox_regdef.yml")
         purl = make_docker_purl(
             "123456789.dkr.ecr.eu-west-1.amazonaws.com/other-org/jaeger:build3",
-            regdef,
+            sandbox_regdef,
         )
         assert purl == "pkg:docker/other-org/jaeger@build3?registry_id=123456789.dkr.ecr.eu-west-1.amazonaws.com"
 
@@ -105,20 +101,18 @@ class TestDockerPurl:
         purl = make_docker_purl("ghcr.io/netcracker/jaeger:1.0")
         assert purl == "pkg:docker/netcracker/jaeger@1.0?registry_id=ghcr.io"
 
-    def test_deep_namespace(self):
+    def test_deep_namespace(self, qubership_regdef):
         """Deep namespace: registry/a/b/c/image:tag."""
-        regdef = load_registry_definition(FIXTURES / "regdefs/qubership_regdef.yml")
-        purl = make_docker_purl("ghcr.io/netcracker/team/sub/image:v2", regdef)
+        purl = make_docker_purl("ghcr.io/netcracker/team/sub/image:v2", qubership_regdef)
         assert purl == "pkg:docker/netcracker/team/sub/image@v2?registry_id=ghcr.io"
 
 
 class TestHelmPurl:
     """Tests for Helm PURL generation."""
 
-    def test_oci_with_regdef(self):
+    def test_oci_with_regdef(self, qubership_regdef):
         """OCI Helm → registry_id=raw hostname."""
-        regdef = load_registry_definition(FIXTURES / "regdefs/qubership_regdef.yml")
-        purl = make_helm_purl("oci://registry.qubership.org/charts/my-chart:1.0", regdef)
+        purl = make_helm_purl("oci://registry.qubership.org/charts/my-chart:1.0", qubership_regdef)
         assert purl == "pkg:helm/charts/my-chart@1.0?registry_id=registry.qubership.org"
 
     def test_without_regdef(self):
@@ -126,12 +120,11 @@ class TestHelmPurl:
         purl = make_helm_purl("oci://registry.example.com/repo/chart:2.0")
         assert purl == "pkg:helm/repo/chart@2.0?registry_id=registry.example.com"
 
-    def test_https_helm(self):
+    def test_https_helm(self, sandbox_regdef):
         """HTTPS Helm reference format."""
-        regdef = load_registry_definition(FIXTURES / "regdefs/sandbox_regdef.yml")
         purl = make_helm_purl(
             "https://nexus.mycompany.internal/repository/helm-charts/my-chart:3.0",
-            regdef,
+            sandbox_regdef,
         )
         assert "pkg:helm/" in purl
         assert "my-chart@3.0" in purl
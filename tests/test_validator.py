@@ -1,48 +1,62 @@
 """Tests for the --validate flag and the validator service."""
 
+import functools
+import io
 import json
+import tarfile
 from pathlib import Path
+from types import MappingProxyType
 from unittest.mock import patch, MagicMock
 
+import click
 import pytest
-from click.testing import CliRunner
+import yaml
 
 from app_manifest.cli import cli
+from app_manifest.services import _json
 from app_manifest.services.validator import validate_manifest
 
 FIXTURES = Path(__file__).parent / "fixtures"
 
+# Setup steps call the command callbacks directly; only the command under
+# test goes through CliRunner.
+_COMPONENT = cli.get_command(click.Context(cli), "component")
+_FETCH = cli.get_command(click.Context(cli), "fetch")
+
 
 # ─── Tests for the validate_manifest service ─────────────────────
 
 
 class TestValidateManifest:
-    def _minimal_valid(self) -> dict:
-        """Minimal valid manifest."""
-        return {
-            "$schema": "../schemas/application-manifest.schema.json",
-            "bomFormat": "CycloneDX",
-            "specVersion": "1.6",
-            "serialNumber": "urn:uuid:c7eb7c5f-b8da-4c05-9c48-678a11c00a35",
-            "version": 1,
-            "metadata": {
-                "timestamp": "2025-01-21T12:00:00Z",
-                "component": {
-                    "bom-ref": "app:abc",
-                    "type": "application",
-                    "mime-type": "application/vnd.nc.application",
-                    "name": "my-app",
-                    "version": "1.0.0",
-                },
-                "tools": {
-                    "components": [
-                        {"type": "application", "name": "am-build-cli", "version": "0.1.0"}
-                    ]
-                },
+    # Built once; tests only replace or delete top-level keys on their copy.
+    _BASE = MappingProxyType({
+        "$schema": "../schemas/application-manifest.schema.json",
+        "bomFormat": "CycloneDX",
+        "specVersion": "1.6",
+        "serialNumber": "urn:uuid:c7eb7c5f-b8da-4c05-9c48-678a11c00a35",
+        "version": 1,
+        "metadata": {
+            "timestamp": "2025-01-21T12:00:00Z",
+            "component": {
+                "bom-ref": "app:abc",
+                "type": "application",
+                "mime-type": "application/vnd.nc.application",
+                "name": "my-app",
+                "version": "1.0.0",
             },
-            "components": [],
-            "dependencies": [],
-        }
+            "tools": {
+                "components": [
+                    {"type": "application", "name": "am-build-cli", "version": "0.1.0"}
+                ]
+            },
+        },
+        "components": [],
+        "dependencies": [],
+    })
+
+    def _minimal_valid(self) -> dict:
+        """Minimal valid manifest (a shallow copy of _BASE)."""
+        return dict(self._BASE)
 
     def test_valid_empty_manifest(self):
         errors = validate_manifest(self._minimal_valid())
@@ -109,12 +123,13 @@ class TestValidateManifest:
         errors = validate_manifest(manifest)
         assert errors == []
 
+    @pytest.mark.xdist_group("jaeger_example")
     def test_example_jaeger_manifest_is_valid(self):
         """The reference Jaeger example must pass validation."""
         example = FIXTURES / "examples/jaeger_manifest.json"
         if not example.exists():
             pytest.skip("example_jaeger_manifest.json not generated yet")
-        data = json.loads(example.read_text(encoding="utf-8"))
+        data = _json.loads(example.read_bytes())
         errors = validate_manifest(data)
         assert errors == [], f"Validation errors: {errors}"
 
@@ -122,17 +137,11 @@ class TestValidateManifest:
 # ─── Tests for the --validate CLI flag ────────────────────────────
 
 
-def _fake_helm_run(cmd, **kwargs):
-    """Mock subprocess.run for helm pull."""
-    import io, tarfile, yaml
-    dest = Path(cmd[cmd.index("--destination") + 1])
-    ref = next(a for a in cmd if a.startswith("oci://"))
-    parts = ref.replace("oci://", "").split(":")
-    version = parts[-1] if len(parts) > 1 else "1.0.0"
-    name = parts[0].split("/")[-1]
-
-    tgz_path = dest / f"{name}-{version}.tgz"
-    with tarfile.open(tgz_path, "w:gz") as tar:
+@functools.lru_cache(maxsize=None)
+def _chart_tgz(name: str, version: str) -> bytes:
+    """Chart archive bytes, built once per (name, version) for the session."""
+    buf = io.BytesIO()
+    with tarfile.open(fileobj=buf, mode="w:gz", compresslevel=1) as tar:
         chart_yaml_bytes = yaml.dump({
             "apiVersion": "v2", "name": name,
             "version": version, "appVersion": version,
@@ -145,20 +154,29 @@ def _fake_helm_run(cmd, **kwargs):
         info = tarfile.TarInfo(name=f"{name}/values.schema.json")
         info.size = len(schema)
         tar.addfile(info, io.BytesIO(schema))
+    return buf.getvalue()
+
 
+def _fake_helm_run(cmd, **kwargs):
+    """Mock subprocess.run for helm pull."""
+    dest = Path(cmd[cmd.index("--destination") + 1])
+    ref = next(a for a in cmd if a.startswith("oci://"))
+    parts = ref.replace("oci://", "").split(":")
+    version = parts[-1] if len(parts) > 1 else "1.0.0"
+    name = parts[0].split("/")[-1]
+
+    (dest / f"{name}-{version}.tgz").write_bytes(_chart_tgz(name, version))
     return MagicMock(returncode=0, stderr="")
 
 
 class TestValidateCLIFlag:
-    def test_validate_flag_in_help(self):
-        runner = CliRunner()
+    def test_validate_flag_in_help(self, runner):
         result = runner.invoke(cli, ["generate", "--help"])
         assert "--validate" in result.output
 
-    def test_generate_without_validate_flag(self, tmp_path):
+    def test_generate_without_validate_flag(self, runner, tmp_path):
         """Without --validate, the file is created and no validation message is shown."""
         out_file = tmp_path / "manifest.json"
-        runner = CliRunner()
         result = runner.invoke(cli, [
             "generate",
             "-c", str(FIXTURES / "configs/minimal_config.yaml"),
@@ -167,23 +185,20 @@ class TestValidateCLIFlag:
         assert result.exit_code == 0
         assert "Manifest is valid." not in result.output
 
-    def test_generate_with_validate_passes(self, tmp_path):
+    def test_generate_with_validate_passes(self, runner, tmp_path):
         """With --validate, a valid manifest → 'Manifest is valid.'"""
         minis_dir = tmp_path / "minis"
         minis_dir.mkdir()
-        runner = CliRunner()
 
         # Build mini-manifests for docker images
         for meta_file in [FIXTURES / "metadata/docker_metadata.json", FIXTURES / "metadata/envoy_metadata.json"]:
             out = minis_dir / f"mini_{meta_file.stem}.json"
-            runner.invoke(cli, ["component", "-i", str(meta_file), "-o", str(out)])
+            _COMPONENT.callback(input_file=meta_file, out=out, registry_def=None)
 
         # Fetch helm chart
         with patch("app_manifest.services.artifact_fetcher.subprocess.run") as mock_run:
             mock_run.side_effect = _fake_helm_run
-            runner.invoke(cli, [
-                "fetch", "-c", str(FIXTURES / "configs/minimal_config.yaml"), "-o", str(minis_dir),
-            ])
+            _FETCH.callback(config=FIXTURES / "configs/minimal_config.yaml", out=minis_dir, registry_def=None)
 
         out_file = tmp_path / "manifest.json"
         result = runner.invoke(cli, [
@@ -197,7 +212,7 @@ class TestValidateCLIFlag:
         assert result.exit_code == 0, result.output
         assert "Manifest is valid." in result.output
 
-    def test_generate_with_validate_fails_on_bad_manifest(self, tmp_path):
+    def test_generate_with_validate_fails_on_bad_manifest(self, runner, tmp_path):
         """If the manifest is invalid after writing — exit code != 0."""
         out_file = tmp_path / "manifest.json"
 
@@ -208,7 +223,6 @@ class TestValidateCLIFlag:
         with patch("app_manifest.cli.validate_manifest") as mock_validate:
             mock_validate.return_value = ["root: 'bomFormat' is not valid"]
 
-            runner = CliRunner()
             result = runner.invoke(cli, [
                 "generate",
                 "-c", str(FIXTURES / "configs/minimal_config.yaml"),
@@ -224,12 +238,11 @@ class TestValidateCLIFlag:
 
 
 class TestValidateCommand:
-    def test_validate_command_in_help(self):
-        runner = CliRunner()
+    def test_validate_command_in_help(self, runner):
         result = runner.invoke(cli, ["--help"])
         assert "validate" in result.output
 
-    def test_validate_valid_manifest(self, tmp_path):
+    def test_validate_valid_manifest(self, runner):
         """Valid manifest → exit code 0 and 'is valid' message."""
         manifest = {
             "$schema": "../schemas/application-manifest.schema.json",
@@ -255,43 +268,58 @@ class TestValidateCommand:
             "components": [],
             "dependencies": [],
         }
-        manifest_file = tmp_path / "manifest.json"
-        manifest_file.write_text(json.dumps(manifest), encoding="utf-8")
 
-        runner = CliRunner()
-        result = runner.invoke(cli, ["validate", "-i", str(manifest_file)])
+        result = runner.invoke(cli, ["validate", "-i", "-"], input=json.dumps(manifest))
 
         assert result.exit_code == 0
-        assert "is valid" in result.output
+        assert "is valid: <stdin>" in result.output
 
-    def test_validate_invalid_manifest(self, tmp_path):
+    def test_validate_invalid_manifest(self, runner):
         """Invalid manifest → exit code != 0 and 'FAILED' message."""
-        manifest_file = tmp_path / "manifest.json"
-        manifest_file.write_text('{"bomFormat": "WRONG"}', encoding="utf-8")
-
-        runner = CliRunner()
-        result = runner.invoke(cli, ["validate", "-i", str(manifest_file)])
+        result = runner.invoke(cli, ["validate", "-i", "-"], input='{"bomFormat": "WRONG"}')
 
         assert result.exit_code != 0
         assert "FAILED" in result.output or "does not conform" in result.output
 
-    def test_validate_invalid_json(self, tmp_path):
+    def test_validate_invalid_json(self, runner, tmp_path):
         """Invalid JSON → exit code != 0."""
         manifest_file = tmp_path / "manifest.json"
         manifest_file.write_text("{not valid json", encoding="utf-8")
 
-        runner = CliRunner()
         result = runner.invoke(cli, ["validate", "-i", str(manifest_file)])
 
         assert result.exit_code != 0
+        assert "Invalid JSON in" in result.output
+
+    def test_validate_invalid_json_from_stdin(self, runner):
+        result = runner.invoke(cli, ["validate", "-i", "-"], input="{not valid json")
+        assert result.exit_code != 0
+        assert "Invalid JSON in <stdin>" in result.output
+
+    @pytest.mark.parametrize("backend", ["default", "stdlib"])
+    @pytest.mark.parametrize("payload", [
+        b"\xef\xbb\xbf{}",
+        b'{"version": NaN}',
+        b"[Infinity]",
+        b"[1e400]",
+        b'["\\ud800"]',
+        b"[" * 100_000,
+    ], ids=["bom", "nan", "infinity", "overflow", "lone-surrogate", "deep-nesting"])
+    def test_validate_rejects_non_strict_json(self, runner, monkeypatch, backend, payload):
+        """Each JSON backend reports these inputs as invalid JSON."""
+        if backend == "stdlib":
+            monkeypatch.setattr(_json, "loads", _json._stdlib_loads)
+        result = runner.invoke(cli, ["validate", "-i", "-"], input=payload)
+        assert result.exit_code != 0
+        assert "Invalid JSON in <stdin>" in result.output
 
-    def test_validate_example_jaeger_manifest(self):
+    @pytest.mark.xdist_group("jaeger_example")
+    def test_validate_example_jaeger_manifest(self, runner):
         """The reference Jaeger example must pass validation."""
         example = FIXTURES / "examples/jaeger_manifest.json"
         if not example.exists():
             pytest.skip("example_jaeger_manifest.json not generated yet")
 
-        runner = CliRunner()
         result = runner.invoke(cli, ["validate", "-i", str(example)])
 
         assert result.exit_code == 0, result.output